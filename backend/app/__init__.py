@@ -1,10 +1,13 @@
 """Flask application factory."""
 
 import os
+import uuid
 import logging
-from flask import Flask, jsonify
+from flask import Flask, jsonify, g
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 from .config import config
 from .extensions import db, migrate, jwt, cors, socketio
+from .json_provider import OrjsonProvider
 
 
 def create_app(config_name=None):
@@ -14,6 +17,7 @@ def create_app(config_name=None):
         config_name = os.environ.get("FLASK_ENV", "development")
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config[config_name])
 
     # Initialize extensions
@@ -22,6 +26,9 @@ def create_app(config_name=None):
     # Register blueprints
     register_blueprints(app)
 
+    # Register request hooks
+    register_request_hooks(app)
+
     # Register error handlers
     register_error_handlers(app)
 
@@ -65,7 +72,6 @@ def register_blueprints(app):
     from .api.imports import imports_bp
     from .api.notifications import notifications_bp
     from .api.templates import templates_bp
-    from .api.teams import teams_bp
 
     app.register_blueprint(health_bp, url_prefix="/api")
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
@@ -83,7 +89,23 @@ def register_blueprints(app):
     app.register_blueprint(imports_bp, url_prefix="/api/import")
     app.register_blueprint(notifications_bp, url_prefix="/api/notifications")
     app.register_blueprint(templates_bp, url_prefix="/api/templates")
-    app.register_blueprint(teams_bp, url_prefix="/api/teams")
+
+
+def register_request_hooks(app):
+    """Register app-wide request hooks."""
+
+    @app.before_request
+    def load_current_user_id():
+        """Parse the JWT identity into a UUID once per request as g.user_id."""
+        g.user_id = None
+        try:
+            verify_jwt_in_request(optional=True)
+        except Exception:
+            # Missing or invalid tokens are reported by @jwt_required on the view
+            return
+        identity = get_jwt_identity()
+        if identity:
+            g.user_id = uuid.UUID(identity)
 
 
 def register_error_handlers(app):
@@ -105,6 +127,10 @@ def register_error_handlers(app):
     def not_found(error):
         return jsonify({"error": "Not found", "message": str(error)}), 404
 
+    @app.errorhandler(413)
+    def request_too_large(error):
+        return jsonify({"error": "Request too large", "message": str(error)}), 413
+
     @app.errorhandler(500)
     def internal_error(error):
         return jsonify({"error": "Internal server error", "message": str(error)}), 500
@@ -0,0 +1,52 @@
+"""Access helpers shared by the API blueprints."""
+
+from flask import g
+from sqlalchemy import and_, bindparam, lambda_stmt, select
+
+from ..extensions import db
+from ..models import OrganizationMember, Project, Workspace
+
+# Project plus the user's membership in its organization, in one round-trip
+PROJECT_ACCESS_STMT = lambda_stmt(
+    lambda: select(Project, OrganizationMember)
+    .join(Workspace, Workspace.id == Project.workspace_id)
+    .join(
+        OrganizationMember,
+        and_(
+            OrganizationMember.organization_id == Workspace.organization_id,
+            OrganizationMember.user_id == bindparam("user_id"),
+        ),
+    )
+    .where(Project.id == bindparam("project_id"))
+)
+
+
+def get_membership(organization_id, user_id):
+    """Get the user's membership in an organization, memoized per request.
+
+    Access checks within one request often resolve to the same organization.
+    The cache lives on flask.g, so it is discarded with the app context when
+    the request ends.
+    """
+    cache = g.setdefault("_org_memberships", {})
+    key = (str(organization_id), str(user_id))
+    if key not in cache:
+        cache[key] = OrganizationMember.query.filter_by(
+            organization_id=organization_id, user_id=user_id
+        ).first()
+    return cache[key]
+
+
+def get_project_access(project_id, user_id):
+    """Get (project, membership) for a project the user can access, else (None, None).
+
+    Memoized per request on flask.g like get_membership.
+    """
+    cache = g.setdefault("_project_access", {})
+    key = (str(project_id), str(user_id))
+    if key not in cache:
+        row = db.session.execute(
+            PROJECT_ACCESS_STMT, {"project_id": project_id, "user_id": user_id}
+        ).first()
+        cache[key] = tuple(row) if row else (None, None)
+    return cache[key]
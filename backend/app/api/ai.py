@@ -3,22 +3,22 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
+from ..extensions import db
 from ..services.ai_service import get_ai_service
-from ..models import Card, Project, Workspace, OrganizationMember, Column, Board
+from ..models import Card, Project, Workspace, Column, Board
+from .access import get_membership
 
 ai_bp = Blueprint("ai", __name__)
 
 
 def check_project_access(project_id, user_id):
     """Check if user has access to project."""
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return None, None
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    workspace = db.session.get(Workspace, project.workspace_id)
+    membership = get_membership(workspace.organization_id, user_id)
 
     return project, membership
 
@@ -37,13 +37,13 @@ def get_card_suggestions(card_id):
     """Get AI suggestions for improving a card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
+    card = db.session.get(Card, card_id)
     if not card:
         return jsonify({"error": "Card not found"}), 404
 
     # Get project access through card -> column -> board -> project
-    column = Column.query.get(card.column_id)
-    board = Board.query.get(column.board_id)
+    column = db.session.get(Column, card.column_id)
+    board = db.session.get(Board, column.board_id)
     project, membership = check_project_access(board.project_id, user_id)
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -130,8 +130,8 @@ def generate_sprint_goal():
         return jsonify({"error": "No valid cards found"}), 404
 
     # Check project access via first card
-    column = Column.query.get(cards[0].column_id)
-    board = Board.query.get(column.board_id)
+    column = db.session.get(Column, cards[0].column_id)
+    board = db.session.get(Board, column.board_id)
     project, membership = check_project_access(board.project_id, user_id)
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
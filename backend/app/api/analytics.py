@@ -10,20 +10,19 @@ from ..models import (
     Sprint, SprintStatus, CardSprint, Card, Column, Project, Workspace,
     OrganizationMember, DailyLog, User
 )
+from .access import get_membership
 
 analytics_bp = Blueprint("analytics", __name__)
 
 
 def check_project_access(project_id, user_id):
     """Check if user has access to project."""
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return None, None
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    workspace = db.session.get(Workspace, project.workspace_id)
+    membership = get_membership(workspace.organization_id, user_id)
 
     return project, membership
 
@@ -86,7 +85,7 @@ def get_burndown(sprint_id):
     """Get burndown chart data for a sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -174,7 +173,7 @@ def get_team_workload():
         return jsonify({"error": "Forbidden"}), 403
 
     # Get workspace for org members
-    workspace = Workspace.query.get(project.workspace_id)
+    workspace = db.session.get(Workspace, project.workspace_id)
     members = OrganizationMember.query.filter_by(
         organization_id=workspace.organization_id
     ).all()
@@ -182,14 +181,14 @@ def get_team_workload():
     workload_data = []
 
     for member in members:
-        user = User.query.get(member.user_id)
+        user = db.session.get(User, member.user_id)
         if not user:
             continue
 
         # Get cards assigned to this user
         if sprint_id:
             # Filter by sprint
-            sprint = Sprint.query.get(sprint_id)
+            sprint = db.session.get(Sprint, sprint_id)
             if not sprint:
                 continue
             sprint_card_ids = [assoc.card_id for assoc in sprint.card_associations]
@@ -368,7 +367,7 @@ def get_time_vs_estimate():
 
     # If sprint_id provided, filter by sprint
     if sprint_id:
-        sprint = Sprint.query.get(sprint_id)
+        sprint = db.session.get(Sprint, sprint_id)
         if sprint:
             sprint_card_ids = [str(assoc.card_id) for assoc in sprint.card_associations]
             cards = Card.query.filter(Card.id.in_(sprint_card_ids)).all()
@@ -456,7 +455,7 @@ def get_individual_velocity():
     ).order_by(Sprint.end_date.desc()).limit(sprints_count).all()
 
     # Get workspace for org members
-    workspace = Workspace.query.get(project.workspace_id)
+    workspace = db.session.get(Workspace, project.workspace_id)
     members = OrganizationMember.query.filter_by(
         organization_id=workspace.organization_id
     ).all()
@@ -464,7 +463,7 @@ def get_individual_velocity():
     member_velocities = {}
 
     for member in members:
-        user = User.query.get(member.user_id)
+        user = db.session.get(User, member.user_id)
         if not user:
             continue
 
@@ -588,7 +587,7 @@ def get_invisible_work():
     # Get user names
     user_data = []
     for user_id_str, data in time_per_user.items():
-        user = User.query.get(user_id_str)
+        user = db.session.get(User, user_id_str)
         if user:
             data["user_name"] = user.full_name or user.email
             data["orphan_percent"] = round(data["orphan_time"] / data["total_time"] * 100, 1) if data["total_time"] > 0 else 0
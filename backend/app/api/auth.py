@@ -105,7 +105,7 @@ def logout():
 def get_current_user():
     """Get current authenticated user."""
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
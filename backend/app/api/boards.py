@@ -8,7 +8,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import Schema, fields, validate, ValidationError
 
 from ..extensions import db
-from ..models import Board, Project, Workspace, OrganizationMember, Column
+from ..models import Board, Project, Workspace, Column
+from .access import get_membership
 from ..models.column import DEFAULT_COLUMNS
 
 boards_bp = Blueprint("boards", __name__)
@@ -24,14 +25,12 @@ board_schema = BoardSchema()
 
 def check_project_access(project_id, user_id):
     """Check if user has access to project."""
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return None, None, None
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    workspace = db.session.get(Workspace, project.workspace_id)
+    membership = get_membership(workspace.organization_id, user_id)
 
     return project, workspace, membership
 
@@ -99,7 +98,7 @@ def get_board(board_id):
     """Get board with columns and cards."""
     user_id = get_jwt_identity()
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -126,7 +125,7 @@ def update_board(board_id):
     """Update board."""
     user_id = get_jwt_identity()
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -148,7 +147,7 @@ def delete_board(board_id):
     """Delete board."""
     user_id = get_jwt_identity()
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -170,7 +169,7 @@ def export_board(board_id):
     user_id = get_jwt_identity()
     export_format = request.args.get("format", "csv")
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -238,7 +237,7 @@ def export_board_summary(board_id):
     """Export board summary as JSON (for PDF generation on frontend)."""
     user_id = get_jwt_identity()
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
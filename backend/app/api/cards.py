@@ -1,11 +1,16 @@
 """Card endpoints with domain event emission."""
 
 from uuid import UUID
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime, timedelta
+from flask import Blueprint, request, jsonify, g
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from marshmallow import Schema, fields, validate, ValidationError
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import contains_eager, load_only, selectinload
 
 from ..extensions import db
+from .. import tasks
 import os
 import uuid as uuid_lib
 from werkzeug.utils import secure_filename
@@ -15,11 +20,14 @@ from ..models import (
     CardAssignee, CardLabel, Label, Comment, Priority, ActivityLog, Subtask,
     CardLink, LinkType, INVERSE_LINK_TYPES, Attachment
 )
+from .access import get_membership
 
 # File upload configuration
 UPLOAD_FOLDER = os.environ.get("UPLOAD_FOLDER", "uploads")
 ALLOWED_EXTENSIONS = {"txt", "pdf", "png", "jpg", "jpeg", "gif", "doc", "docx", "xls", "xlsx", "csv", "zip", "md"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+# Uploads still unfinished after this were lost (e.g. the worker restarted)
+ATTACHMENT_UPLOAD_TIMEOUT = timedelta(minutes=10)
 
 
 def allowed_file(filename):
@@ -49,6 +57,15 @@ class CommentSchema(Schema):
     content = fields.Str(required=True, validate=validate.Length(min=1))
 
 
+# Columns and relationships read by Card.to_list_dto(), loaded up front
+CARD_LIST_LOADERS = (
+    load_only(
+        Card.id, Card.column_id, Card.title, Card.position, Card.priority, Card.due_date
+    ),
+    selectinload(Card.assignees),
+    selectinload(Card.labels),
+)
+
 card_create_schema = CardCreateSchema()
 card_move_schema = CardMoveSchema()
 comment_schema = CommentSchema()
@@ -56,32 +73,76 @@ comment_schema = CommentSchema()
 
 def check_column_access(column_id, user_id):
     """Check if user has access to column's board."""
-    column = Column.query.get(column_id)
+    column = db.session.get(Column, column_id)
     if not column:
         return None, None, None
 
-    board = Board.query.get(column.board_id)
-    project = Project.query.get(board.project_id)
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    board = db.session.get(Board, column.board_id)
+    project = db.session.get(Project, board.project_id)
+    workspace = db.session.get(Workspace, project.workspace_id)
+    membership = get_membership(workspace.organization_id, user_id)
 
     return column, board, membership
 
 
+def load_card_access(card_id, user_id):
+    """Load a card, its board and the user's membership in one query.
+
+    Returns (card, board, membership); membership is None when the user
+    is not a member of the owning organization. Returns None if the card
+    does not exist.
+    """
+    return (
+        db.session.query(Card, Board, OrganizationMember)
+        .join(Column, Column.id == Card.column_id)
+        .join(Board, Board.id == Column.board_id)
+        .join(Project, Project.id == Board.project_id)
+        .join(Workspace, Workspace.id == Project.workspace_id)
+        .outerjoin(
+            OrganizationMember,
+            db.and_(
+                OrganizationMember.organization_id == Workspace.organization_id,
+                OrganizationMember.user_id == user_id,
+            ),
+        )
+        .filter(Card.id == card_id)
+        .first()
+    )
+
+
+@cards_bp.before_request
+def load_card_context():
+    """Resolve the card and access for every /<card_id> route before the view runs."""
+    card_id = (request.view_args or {}).get("card_id")
+    if card_id is None:
+        return None
+
+    verify_jwt_in_request()
+    row = load_card_access(card_id, get_jwt_identity())
+    if not row:
+        return jsonify({"error": "Card not found"}), 404
+
+    card, board, membership = row
+    if not membership:
+        return jsonify({"error": "Forbidden"}), 403
+
+    g.card = card
+    g.board = board
+    g.membership = membership
+    return None
+
+
 def emit_card_event(event_type: str, card: Card, actor_id: str, payload: dict = None):
     """Emit a card domain event."""
-    board = Board.query.get(card.column.board_id)
-
+    # The column already carries the board id, so no Board lookup is needed.
     event = DomainEventBase(
         event_type=event_type,
         aggregate_type="card",
         aggregate_id=card.id,
         actor_id=UUID(actor_id),
         payload={
-            "card_id": str(card.id),
-            "board_id": str(board.id),
+            "card_id": card.id_str,
+            "board_id": str(card.column.board_id),
             "column_id": str(card.column_id),
             **(payload or {}),
         },
@@ -101,9 +162,11 @@ def list_cards():
         column, board, membership = check_column_access(column_id, user_id)
         if not membership:
             return jsonify({"error": "Forbidden"}), 403
-        cards = Card.query.filter_by(column_id=column_id).order_by(Card.position).all()
+        cards = Card.query.options(*CARD_LIST_LOADERS).filter_by(
+            column_id=column_id
+        ).order_by(Card.position).all()
     elif board_id:
-        board = Board.query.get(board_id)
+        board = db.session.get(Board, board_id)
         if not board:
             return jsonify({"error": "Board not found"}), 404
         # Check access via any column
@@ -111,13 +174,16 @@ def list_cards():
             _, _, membership = check_column_access(board.columns[0].id, user_id)
             if not membership:
                 return jsonify({"error": "Forbidden"}), 403
-        cards = Card.query.join(Column).filter(Column.board_id == board_id).order_by(
+        # The JOIN is already in the query, so populate Card.column from it
+        cards = Card.query.join(Column).options(
+            contains_eager(Card.column), *CARD_LIST_LOADERS
+        ).filter(Column.board_id == board_id).order_by(
             Column.position, Card.position
         ).all()
     else:
         return jsonify({"error": "column_id or board_id required"}), 400
 
-    return jsonify({"cards": [c.to_dict() for c in cards]})
+    return jsonify({"cards": [c.to_list_dto() for c in cards]})
 
 
 @cards_bp.route("/", methods=["POST"])
@@ -167,15 +233,8 @@ def create_card():
 @jwt_required()
 def get_card(card_id):
     """Get card with full details."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
+    fail_stale_uploads(card_id)
 
     return jsonify({"card": card.to_dict(include_details=True)})
 
@@ -186,13 +245,7 @@ def update_card(card_id):
     """Update card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     data = request.json
     changes = {}
@@ -227,16 +280,10 @@ def delete_card(card_id):
     """Delete card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     card_title = card.title
-    board_id = board.id
+    board_id = g.board.id
 
     db.session.delete(card)
     db.session.commit()
@@ -254,6 +301,19 @@ def delete_card(card_id):
     return jsonify({"message": "Card deleted"})
 
 
+# Make room in the target column and move the card atomically.
+MOVE_CARD_SQL = text("""
+    WITH shifted AS (
+        UPDATE cards
+        SET position = position + 1, updated_at = :now
+        WHERE column_id = :column_id AND id <> :card_id AND position >= :position
+    )
+    UPDATE cards
+    SET column_id = :column_id, position = :position, updated_at = :now
+    WHERE id = :card_id
+""")
+
+
 @cards_bp.route("/<uuid:card_id>/move", methods=["PUT"])
 @jwt_required()
 def move_card(card_id):
@@ -265,14 +325,8 @@ def move_card(card_id):
     except ValidationError as err:
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    # Check access to source column
-    source_column, source_board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
+    source_board = g.board
 
     # Check access to target column
     target_column, target_board, _ = check_column_access(data["column_id"], user_id)
@@ -287,19 +341,13 @@ def move_card(card_id):
     from_column_id = card.column_id
     from_position = card.position
 
-    # Update card
-    card.column_id = data["column_id"]
-    card.position = data["position"]
-
-    # Reorder other cards in target column
-    cards_to_shift = Card.query.filter(
-        Card.column_id == data["column_id"],
-        Card.id != card_id,
-        Card.position >= data["position"]
-    ).all()
-    for c in cards_to_shift:
-        c.position += 1
-
+    # Shift siblings and place the card in one statement
+    db.session.execute(MOVE_CARD_SQL, {
+        "card_id": card_id,
+        "column_id": data["column_id"],
+        "position": data["position"],
+        "now": datetime.utcnow(),
+    })
     db.session.commit()
 
     # Emit move event
@@ -334,27 +382,23 @@ def assign_card(card_id):
     """Assign user to card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     assignee_id = request.json.get("user_id")
     if not assignee_id:
         return jsonify({"error": "user_id required"}), 400
 
-    # Check if already assigned
-    existing = CardAssignee.query.filter_by(
-        card_id=card_id, user_id=assignee_id
-    ).first()
-    if existing:
+    # The (card_id, user_id) primary key rejects duplicates in the same statement
+    result = db.session.execute(
+        pg_insert(CardAssignee)
+        .values(card_id=card_id, user_id=assignee_id)
+        .on_conflict_do_nothing(index_elements=["card_id", "user_id"])
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
         return jsonify({"error": "User already assigned"}), 409
-
-    assignee = CardAssignee(card_id=card_id, user_id=assignee_id)
-    db.session.add(assignee)
+    # Assignees are part of the card payload; bump it so column ETags change
+    card.updated_at = datetime.utcnow()
     db.session.commit()
 
     # Emit event
@@ -369,13 +413,7 @@ def unassign_card(card_id, assignee_id):
     """Remove user assignment from card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     assignee = CardAssignee.query.filter_by(
         card_id=card_id, user_id=assignee_id
@@ -384,6 +422,7 @@ def unassign_card(card_id, assignee_id):
         return jsonify({"error": "Assignment not found"}), 404
 
     db.session.delete(assignee)
+    card.updated_at = datetime.utcnow()
     db.session.commit()
 
     # Emit event
@@ -403,13 +442,7 @@ def add_comment(card_id):
     except ValidationError as err:
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     comment = Comment(
         card_id=card_id,
@@ -432,21 +465,13 @@ def add_comment(card_id):
 @jwt_required()
 def add_label_to_card(card_id):
     """Add label to card."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     label_id = request.json.get("label_id")
     if not label_id:
         return jsonify({"error": "label_id required"}), 400
 
-    label = Label.query.get(label_id)
+    label = db.session.get(Label, label_id)
     if not label:
         return jsonify({"error": "Label not found"}), 404
 
@@ -459,6 +484,7 @@ def add_label_to_card(card_id):
 
     card_label = CardLabel(card_id=card_id, label_id=label_id)
     db.session.add(card_label)
+    card.updated_at = datetime.utcnow()
     db.session.commit()
 
     return jsonify({"card": card.to_dict(include_details=True)})
@@ -468,15 +494,7 @@ def add_label_to_card(card_id):
 @jwt_required()
 def remove_label_from_card(card_id, label_id):
     """Remove label from card."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     card_label = CardLabel.query.filter_by(
         card_id=card_id, label_id=label_id
@@ -485,6 +503,7 @@ def remove_label_from_card(card_id, label_id):
         return jsonify({"error": "Label not on card"}), 404
 
     db.session.delete(card_label)
+    card.updated_at = datetime.utcnow()
     db.session.commit()
 
     return jsonify({"card": card.to_dict(include_details=True)})
@@ -494,16 +513,6 @@ def remove_label_from_card(card_id, label_id):
 @jwt_required()
 def get_card_activity(card_id):
     """Get activity logs for a card."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     activities = ActivityLog.query.filter_by(card_id=card_id).order_by(
         ActivityLog.created_at.desc()
     ).limit(50).all()
@@ -513,10 +522,10 @@ def get_card_activity(card_id):
 
 # Subtask endpoints
 
+
 class SubtaskSchema(Schema):
     title = fields.Str(required=True, validate=validate.Length(min=1, max=500))
 
-
 subtask_schema = SubtaskSchema()
 
 
@@ -524,15 +533,7 @@ subtask_schema = SubtaskSchema()
 @jwt_required()
 def list_subtasks(card_id):
     """List subtasks for a card."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
 
     return jsonify({"subtasks": [s.to_dict() for s in card.subtasks]})
 
@@ -541,21 +542,11 @@ def list_subtasks(card_id):
 @jwt_required()
 def create_subtask(card_id):
     """Create a subtask for a card."""
-    user_id = get_jwt_identity()
-
     try:
         data = subtask_schema.load(request.json)
     except ValidationError as err:
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     # Get next position
     max_pos = db.session.query(db.func.max(Subtask.position)).filter_by(
         card_id=card_id
@@ -576,16 +567,6 @@ def create_subtask(card_id):
 @jwt_required()
 def update_subtask(card_id, subtask_id):
     """Update a subtask."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     subtask = Subtask.query.filter_by(id=subtask_id, card_id=card_id).first()
     if not subtask:
         return jsonify({"error": "Subtask not found"}), 404
@@ -607,16 +588,6 @@ def update_subtask(card_id, subtask_id):
 @jwt_required()
 def delete_subtask(card_id, subtask_id):
     """Delete a subtask."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     subtask = Subtask.query.filter_by(id=subtask_id, card_id=card_id).first()
     if not subtask:
         return jsonify({"error": "Subtask not found"}), 404
@@ -629,26 +600,25 @@ def delete_subtask(card_id, subtask_id):
 
 # Card Link endpoints
 
-VALID_LINK_TYPES = ["blocks", "blocked_by", "relates_to", "duplicates", "duplicated_by"]
+VALID_LINK_TYPES = frozenset(t.value for t in LinkType)
 
 
 @cards_bp.route("/<uuid:card_id>/links", methods=["GET"])
 @jwt_required()
 def list_card_links(card_id):
     """List all links for a card (both outgoing and incoming)."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
-    # Get outgoing and incoming links
-    outgoing = CardLink.query.filter_by(source_card_id=card_id).all()
-    incoming = CardLink.query.filter_by(target_card_id=card_id).all()
+    # Fetch outgoing and incoming links in one query, then partition
+    links = CardLink.query.options(
+        selectinload(CardLink.source_card),
+        selectinload(CardLink.target_card),
+    ).filter(
+        db.or_(
+            CardLink.source_card_id == card_id,
+            CardLink.target_card_id == card_id
+        )
+    ).all()
+    outgoing = [l for l in links if l.source_card_id == card_id]
+    incoming = [l for l in links if l.target_card_id == card_id]
 
     return jsonify({
         "links": {
@@ -664,14 +634,6 @@ def create_card_link(card_id):
     """Create a link from this card to another card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     data = request.json
     target_card_id = data.get("target_card_id")
     link_type_str = data.get("link_type")
@@ -680,14 +642,15 @@ def create_card_link(card_id):
         return jsonify({"error": "target_card_id and link_type required"}), 400
 
     if link_type_str not in VALID_LINK_TYPES:
-        return jsonify({"error": f"Invalid link_type. Must be one of: {VALID_LINK_TYPES}"}), 400
+        return jsonify({"error": f"Invalid link_type. Must be one of: {sorted(VALID_LINK_TYPES)}"}), 400
+    link_type = LinkType(link_type_str)
 
     # Prevent self-linking
     if str(card_id) == target_card_id:
         return jsonify({"error": "Cannot link a card to itself"}), 400
 
     # Check target card exists and user has access
-    target_card = Card.query.get(target_card_id)
+    target_card = db.session.get(Card, target_card_id)
     if not target_card:
         return jsonify({"error": "Target card not found"}), 404
 
@@ -695,7 +658,7 @@ def create_card_link(card_id):
     existing = CardLink.query.filter_by(
         source_card_id=card_id,
         target_card_id=target_card_id,
-        link_type=LinkType(link_type_str)
+        link_type=link_type
     ).first()
     if existing:
         return jsonify({"error": "Link already exists"}), 409
@@ -703,7 +666,7 @@ def create_card_link(card_id):
     link = CardLink(
         source_card_id=card_id,
         target_card_id=target_card_id,
-        link_type=LinkType(link_type_str),
+        link_type=link_type,
         created_by=user_id,
     )
     db.session.add(link)
@@ -716,16 +679,6 @@ def create_card_link(card_id):
 @jwt_required()
 def delete_card_link(card_id, link_id):
     """Delete a card link."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     # Find link where this card is either source or target
     link = CardLink.query.filter(
         CardLink.id == link_id,
@@ -746,19 +699,40 @@ def delete_card_link(card_id, link_id):
 
 # Attachment endpoints
 
+
+def fail_stale_uploads(card_id):
+    """Mark a card's uploads lost by their background job as failed.
+
+    finalize_attachment marks its own failures, but jobs queued in a worker
+    that restarted never run; their attachments would stay "uploading".
+    """
+    cutoff = datetime.utcnow() - ATTACHMENT_UPLOAD_TIMEOUT
+    stale_paths = db.session.scalars(
+        update(Attachment)
+        .where(
+            Attachment.card_id == card_id,
+            Attachment.status == "uploading",
+            Attachment.created_at < cutoff,
+        )
+        .values(status="failed", updated_at=datetime.utcnow())
+        .returning(Attachment.storage_path)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if not stale_paths:
+        return
+
+    db.session.commit()
+    for storage_path in stale_paths:
+        if os.path.exists(f"{storage_path}.part"):
+            os.remove(f"{storage_path}.part")
+
+
 @cards_bp.route("/<uuid:card_id>/attachments", methods=["GET"])
 @jwt_required()
 def list_attachments(card_id):
     """List attachments for a card."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
+    card = g.card
+    fail_stale_uploads(card_id)
 
     return jsonify({"attachments": [a.to_dict() for a in card.attachments]})
 
@@ -769,14 +743,6 @@ def upload_attachment(card_id):
     """Upload an attachment to a card."""
     user_id = get_jwt_identity()
 
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     if "file" not in request.files:
         return jsonify({"error": "No file provided"}), 400
 
@@ -805,9 +771,10 @@ def upload_attachment(card_id):
     os.makedirs(card_upload_dir, exist_ok=True)
 
     storage_path = os.path.join(card_upload_dir, storage_filename)
+    tmp_path = f"{storage_path}.part"
 
-    # Save file
-    file.save(storage_path)
+    # Receive the upload; moving it into place and hashing happen in the background
+    file.save(tmp_path)
 
     # Get MIME type
     mime_type = file.content_type or "application/octet-stream"
@@ -820,34 +787,28 @@ def upload_attachment(card_id):
         file_size=file_size,
         mime_type=mime_type,
         uploaded_by=user_id,
+        status="uploading",
     )
     db.session.add(attachment)
     db.session.commit()
 
-    return jsonify({"attachment": attachment.to_dict()}), 201
+    tasks.submit(tasks.finalize_attachment, attachment.id, tmp_path, storage_path)
+
+    return jsonify({"attachment": attachment.to_dict()}), 202
 
 
 @cards_bp.route("/<uuid:card_id>/attachments/<uuid:attachment_id>", methods=["DELETE"])
 @jwt_required()
 def delete_attachment(card_id, attachment_id):
     """Delete an attachment."""
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     attachment = Attachment.query.filter_by(id=attachment_id, card_id=card_id).first()
     if not attachment:
         return jsonify({"error": "Attachment not found"}), 404
 
-    # Delete file from storage
-    if os.path.exists(attachment.storage_path):
-        os.remove(attachment.storage_path)
+    # Delete file from storage (including a still-uploading partial file)
+    for path in (attachment.storage_path, f"{attachment.storage_path}.part"):
+        if os.path.exists(path):
+            os.remove(path)
 
     db.session.delete(attachment)
     db.session.commit()
@@ -861,20 +822,17 @@ def download_attachment(card_id, attachment_id):
     """Download an attachment."""
     from flask import send_file
 
-    user_id = get_jwt_identity()
-
-    card = Card.query.get(card_id)
-    if not card:
-        return jsonify({"error": "Card not found"}), 404
-
-    column, board, membership = check_column_access(card.column_id, user_id)
-    if not membership:
-        return jsonify({"error": "Forbidden"}), 403
-
     attachment = Attachment.query.filter_by(id=attachment_id, card_id=card_id).first()
     if not attachment:
         return jsonify({"error": "Attachment not found"}), 404
 
+    if attachment.status == "uploading":
+        fail_stale_uploads(card_id)
+    if attachment.status == "failed":
+        return jsonify({"error": "Attachment upload failed, please upload it again"}), 409
+    if attachment.status != "ready":
+        return jsonify({"error": "Attachment is still uploading"}), 409
+
     if not os.path.exists(attachment.storage_path):
         return jsonify({"error": "File not found on server"}), 404
 
@@ -1,16 +1,25 @@
 """Column endpoints."""
 
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from marshmallow import Schema, fields, validate, ValidationError
+from datetime import datetime
+from flask import Blueprint, request, jsonify, g
+from flask_jwt_extended import jwt_required
+from marshmallow import Schema, fields, validate, ValidationError, EXCLUDE
+from sqlalchemy import (
+    bindparam, case, exists, func, insert, lambda_stmt, select, update
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..extensions import db
-from ..models import Column, Board, Project, Workspace, OrganizationMember
+from ..models import Column, Board, Card, Project, Workspace, OrganizationMember
+from .etags import make_etag, not_modified
 
 columns_bp = Blueprint("columns", __name__)
 
 
 class ColumnSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
     board_id = fields.UUID(required=True)
     name = fields.Str(required=True, validate=validate.Length(min=1, max=255))
     wip_limit = fields.Int(required=False, allow_none=True)
@@ -18,6 +27,9 @@ class ColumnSchema(Schema):
 
 
 class ReorderSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
     column_ids = fields.List(fields.UUID(), required=True)
 
 
@@ -25,83 +37,109 @@ column_schema = ColumnSchema()
 reorder_schema = ReorderSchema()
 
 
-def check_board_access(board_id, user_id):
-    """Check if user has access to board."""
-    board = Board.query.get(board_id)
-    if not board:
-        return None, None
+# Built once as a lambda statement so its compiled SQL is cached
+BOARD_ACCESS_STMT = lambda_stmt(
+    lambda: select(
+        exists()
+        .where(Board.id == bindparam("board_id"))
+        .where(Project.id == Board.project_id)
+        .where(Workspace.id == Project.workspace_id)
+        .where(
+            OrganizationMember.organization_id == Workspace.organization_id,
+            OrganizationMember.user_id == bindparam("user_id"),
+        )
+    )
+)
 
-    project = Project.query.get(board.project_id)
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
 
-    return board, membership
+def has_board_access(board_id, user_id):
+    """Check if user is a member of the organization that owns the board."""
+    return db.session.scalar(
+        BOARD_ACCESS_STMT, {"board_id": board_id, "user_id": user_id}
+    )
 
 
 @columns_bp.route("/", methods=["POST"])
 @jwt_required()
 def create_column():
     """Create a new column."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     try:
         data = column_schema.load(request.json)
     except ValidationError as err:
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
-    board, membership = check_board_access(data["board_id"], user_id)
-    if not membership:
+    if not has_board_access(data["board_id"], user_id):
         return jsonify({"error": "Forbidden"}), 403
 
-    # Get next position
-    max_pos = db.session.query(db.func.max(Column.position)).filter_by(
-        board_id=data["board_id"]
-    ).scalar() or -1
-
-    column = Column(
-        board_id=data["board_id"],
-        name=data["name"],
-        position=max_pos + 1,
-        wip_limit=data.get("wip_limit"),
-        color=data.get("color"),
+    # Lock the board row so concurrent creates on the same board queue up
+    # and each reads the MAX(position) the previous one committed
+    db.session.execute(select(Board.id).where(Board.id == data["board_id"]).with_for_update())
+    next_position = (
+        select(func.coalesce(func.max(Column.position), -1) + 1)
+        .where(Column.board_id == data["board_id"])
+        .scalar_subquery()
     )
-    db.session.add(column)
+    column = db.session.scalars(
+        insert(Column)
+        .values(
+            board_id=data["board_id"],
+            name=data["name"],
+            wip_limit=data.get("wip_limit"),
+            color=data.get("color"),
+            position=next_position,
+        )
+        .returning(Column)
+    ).one()
+
+    # A new column has no cards; skip the lazy load in to_dict
+    set_committed_value(column, "cards", [])
+    result = column.to_dict()
     db.session.commit()
 
-    return jsonify({"column": column.to_dict()}), 201
+    return jsonify({"column": result}), 201
 
 
 @columns_bp.route("/<uuid:column_id>", methods=["GET"])
 @jwt_required()
 def get_column(column_id):
     """Get column with cards."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
-    column = Column.query.get(column_id)
+    column = db.session.get(Column, column_id)
     if not column:
         return jsonify({"error": "Column not found"}), 404
 
-    board, membership = check_board_access(column.board_id, user_id)
-    if not membership:
+    if not has_board_access(column.board_id, user_id):
         return jsonify({"error": "Forbidden"}), 403
 
-    return jsonify({"column": column.to_dict(include_cards=True)})
+    # The payload includes the cards, so their count and latest update are
+    # part of the version; one aggregate is far cheaper than serializing them.
+    card_count, cards_updated_at = db.session.execute(
+        select(func.count(Card.id), func.max(Card.updated_at)).where(Card.column_id == column.id)
+    ).one()
+    etag = make_etag(column.id, column.updated_at.timestamp(), card_count, cards_updated_at)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    response = jsonify({"column": column.to_dict(include_cards=True)})
+    response.set_etag(etag)
+    return response
 
 
 @columns_bp.route("/<uuid:column_id>", methods=["PUT"])
 @jwt_required()
 def update_column(column_id):
     """Update column."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
-    column = Column.query.get(column_id)
+    column = db.session.get(Column, column_id)
     if not column:
         return jsonify({"error": "Column not found"}), 404
 
-    board, membership = check_board_access(column.board_id, user_id)
-    if not membership:
+    if not has_board_access(column.board_id, user_id):
         return jsonify({"error": "Forbidden"}), 403
 
     data = request.json
@@ -120,14 +158,13 @@ def update_column(column_id):
 @jwt_required()
 def delete_column(column_id):
     """Delete column."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
-    column = Column.query.get(column_id)
+    column = db.session.get(Column, column_id)
     if not column:
         return jsonify({"error": "Column not found"}), 404
 
-    board, membership = check_board_access(column.board_id, user_id)
-    if not membership:
+    if not has_board_access(column.board_id, user_id):
         return jsonify({"error": "Forbidden"}), 403
 
     # Check if column has cards
@@ -144,7 +181,7 @@ def delete_column(column_id):
 @jwt_required()
 def reorder_columns():
     """Reorder columns within a board."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     try:
         data = reorder_schema.load(request.json)
@@ -154,26 +191,39 @@ def reorder_columns():
     if not data["column_ids"]:
         return jsonify({"error": "No columns provided"}), 400
 
-    # Get first column to check access
-    first_column = Column.query.get(data["column_ids"][0])
-    if not first_column:
+    # Resolve every id's board in one query; all must exist and share a board
+    positions = {column_id: position for position, column_id in enumerate(data["column_ids"])}
+    rows = db.session.execute(
+        select(Column.id, Column.board_id).where(Column.id.in_(positions))
+    ).all()
+    if len(rows) != len(positions):
         return jsonify({"error": "Column not found"}), 404
 
-    board, membership = check_board_access(first_column.board_id, user_id)
-    if not membership:
+    board_ids = {row.board_id for row in rows}
+    if len(board_ids) != 1:
+        return jsonify({"error": "Columns must belong to the same board"}), 400
+    board_id = board_ids.pop()
+
+    if not has_board_access(board_id, user_id):
         return jsonify({"error": "Forbidden"}), 403
 
-    # Update positions
-    for position, column_id in enumerate(data["column_ids"]):
-        column = Column.query.get(column_id)
-        if column and column.board_id == first_column.board_id:
-            column.position = position
+    # Update all positions in one statement
+    columns = db.session.scalars(
+        update(Column)
+        .where(Column.board_id == board_id, Column.id.in_(positions))
+        .values(position=case(positions, value=Column.id), updated_at=datetime.utcnow())
+        .returning(Column)
+        .execution_options(synchronize_session=False)
+    ).all()
 
-    db.session.commit()
+    # RETURNING hands back columns already in the session as they were, with
+    # their old positions; set the positions just written on them
+    for column in columns:
+        set_committed_value(column, "position", positions[column.id])
 
-    # Return updated columns
-    columns = Column.query.filter_by(board_id=first_column.board_id).order_by(
-        Column.position
-    ).all()
+    # Serialize before commit so the returned rows are not expired and reloaded
+    columns.sort(key=lambda c: c.position)
+    result = [c.to_dict() for c in columns]
+    db.session.commit()
 
-    return jsonify({"columns": [c.to_dict() for c in columns]})
+    return jsonify({"columns": result})
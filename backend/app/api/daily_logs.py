@@ -1,23 +1,36 @@
 """Daily log endpoints for time tracking."""
 
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from marshmallow import Schema, fields, validate, ValidationError
-from datetime import date, datetime, timedelta
+from flask import Blueprint, request, jsonify, g
+from flask_jwt_extended import jwt_required
+from marshmallow import Schema, fields, validate, ValidationError, EXCLUDE
+from datetime import datetime, timedelta
+from sqlalchemy import Integer, bindparam, cast, column, func, lambda_stmt, select, true
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import contains_eager, load_only
 
 from ..extensions import db
-from ..models import DailyLog, Project, Workspace, OrganizationMember, Card
+from ..models import (
+    DailyLog, Project, Card, CardAssignee, Column, Board
+)
+from .access import PROJECT_ACCESS_STMT
+from .etags import make_etag, not_modified
 
 daily_logs_bp = Blueprint("daily_logs", __name__)
 
 
 class TaskWorkedSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
     card_id = fields.UUID(required=True)
     time_spent = fields.Int(required=True, validate=validate.Range(min=0))  # minutes
     notes = fields.Str(required=False)
 
 
 class DailyLogSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
     project_id = fields.UUID(required=True)
     log_date = fields.Date(required=False)  # Defaults to today
     tasks_worked = fields.List(fields.Nested(TaskWorkedSchema), required=False)
@@ -26,36 +39,64 @@ class DailyLogSchema(Schema):
     notes = fields.Str(required=False)
 
 
+class DailyLogFilterSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    project_id = fields.UUID(required=True)
+    start_date = fields.Date(required=False)
+    end_date = fields.Date(required=False)
+    user_id = fields.UUID(required=False)
+
+
 daily_log_schema = DailyLogSchema()
+daily_log_filter_schema = DailyLogFilterSchema()
+
+
+# Hot lookups are built as lambda statements so SQLAlchemy caches their
+# compiled SQL and skips rebuilding the statement on every request.
+# Days are counted back from the database's CURRENT_DATE, the same clock
+# that fills in log_date when a log is created without one.
+DAILY_LOG_DAYS_AGO_STMT = lambda_stmt(
+    lambda: select(DailyLog).where(
+        DailyLog.user_id == bindparam("user_id"),
+        DailyLog.project_id == bindparam("project_id"),
+        DailyLog.log_date == func.current_date() - bindparam("days_ago", type_=Integer()),
+    )
+)
 
 
 def check_project_access(project_id, user_id):
     """Check if user has access to project."""
-    project = Project.query.get(project_id)
-    if not project:
+    row = db.session.execute(
+        PROJECT_ACCESS_STMT, {"project_id": project_id, "user_id": user_id}
+    ).first()
+    if not row:
         return None, None
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    return row
+
 
-    return project, membership
+def get_daily_log_days_ago(user_id, project_id, days_ago=0):
+    """Get a user's log for a project from days_ago days before today, if any."""
+    return db.session.scalars(
+        DAILY_LOG_DAYS_AGO_STMT,
+        {"user_id": user_id, "project_id": project_id, "days_ago": days_ago},
+    ).first()
 
 
 @daily_logs_bp.route("/", methods=["GET"])
 @jwt_required()
 def list_daily_logs():
     """List daily logs with filters."""
-    user_id = get_jwt_identity()
-    project_id = request.args.get("project_id")
-    start_date = request.args.get("start_date")
-    end_date = request.args.get("end_date")
-    user_filter = request.args.get("user_id")
+    user_id = g.user_id
 
-    if not project_id:
-        return jsonify({"error": "project_id required"}), 400
+    try:
+        filters = daily_log_filter_schema.load(request.args)
+    except ValidationError as err:
+        return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
+    project_id = filters["project_id"]
     project, membership = check_project_access(project_id, user_id)
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -63,25 +104,14 @@ def list_daily_logs():
     query = DailyLog.query.filter_by(project_id=project_id)
 
     # Filter by user (default to current user)
-    if user_filter:
-        query = query.filter_by(user_id=user_filter)
-    else:
-        query = query.filter_by(user_id=user_id)
-
-    # Filter by date range
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-            query = query.filter(DailyLog.log_date >= start)
-        except ValueError:
-            return jsonify({"error": "Invalid start_date format"}), 400
-
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-            query = query.filter(DailyLog.log_date <= end)
-        except ValueError:
-            return jsonify({"error": "Invalid end_date format"}), 400
+    query = query.filter_by(user_id=filters.get("user_id", user_id))
+
+    # Filter by half-open date range [start_date, end_date + 1 day)
+    if "start_date" in filters or "end_date" in filters:
+        end = filters.get("end_date")
+        query = query.filter(DailyLog.log_date_range(
+            filters.get("start_date"), end + timedelta(days=1) if end else None
+        ))
 
     logs = query.order_by(DailyLog.log_date.desc()).limit(30).all()
     return jsonify({"daily_logs": [log.to_dict() for log in logs]})
@@ -91,7 +121,7 @@ def list_daily_logs():
 @jwt_required()
 def get_today_log():
     """Get today's log for a project."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
     project_id = request.args.get("project_id")
 
     if not project_id:
@@ -101,11 +131,7 @@ def get_today_log():
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
 
-    log = DailyLog.query.filter_by(
-        user_id=user_id,
-        project_id=project_id,
-        log_date=date.today()
-    ).first()
+    log = get_daily_log_days_ago(user_id, project_id)
 
     if not log:
         return jsonify({"daily_log": None, "suggestions": get_task_suggestions(user_id, project_id)})
@@ -117,7 +143,7 @@ def get_today_log():
 @jwt_required()
 def create_or_update_daily_log():
     """Create or update a daily log."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
     try:
         data = daily_log_schema.load(request.json)
@@ -128,52 +154,46 @@ def create_or_update_daily_log():
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
 
-    log_date = data.get("log_date", date.today())
-
-    # Find existing log or create new one
-    log = DailyLog.query.filter_by(
-        user_id=user_id,
-        project_id=data["project_id"],
-        log_date=log_date
-    ).first()
-
-    if log:
-        # Update existing
-        if "tasks_worked" in data:
-            log.tasks_worked = data["tasks_worked"]
-            log.total_time_spent = sum(t.get("time_spent", 0) for t in data["tasks_worked"])
-        if "remaining_work" in data:
-            log.remaining_work = data["remaining_work"]
-        if "blockers" in data:
-            log.blockers = data["blockers"]
-        if "notes" in data:
-            log.notes = data["notes"]
-    else:
-        # Create new
-        tasks = data.get("tasks_worked", [])
-        log = DailyLog(
-            user_id=user_id,
-            project_id=data["project_id"],
-            log_date=log_date,
-            tasks_worked=tasks,
-            total_time_spent=sum(t.get("time_spent", 0) for t in tasks),
-            remaining_work=data.get("remaining_work"),
-            blockers=data.get("blockers"),
-            notes=data.get("notes"),
+    values = {
+        "user_id": user_id,
+        "project_id": data["project_id"],
+        "tasks_worked": data.get("tasks_worked", []),
+        "remaining_work": data.get("remaining_work"),
+        "blockers": data.get("blockers"),
+        "notes": data.get("notes"),
+    }
+    # Without a log_date the column's CURRENT_DATE default applies
+    if "log_date" in data:
+        values["log_date"] = data["log_date"]
+
+    # Insert the day's log, or update only the fields sent if it already exists
+    stmt = pg_insert(DailyLog).values(**values)
+    updates = {
+        field: stmt.excluded[field]
+        for field in ("tasks_worked", "remaining_work", "blockers", "notes")
+        if field in data
+    }
+    updates["updated_at"] = datetime.utcnow()
+    log = db.session.scalars(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id", "project_id", "log_date"], set_=updates
         )
-        db.session.add(log)
+        .returning(DailyLog)
+        .execution_options(populate_existing=True)
+    ).one()
 
+    result = log.to_dict()
     db.session.commit()
-    return jsonify({"daily_log": log.to_dict()}), 201
+    return jsonify({"daily_log": result}), 201
 
 
 @daily_logs_bp.route("/<uuid:log_id>", methods=["GET"])
 @jwt_required()
 def get_daily_log(log_id):
     """Get a specific daily log."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
-    log = DailyLog.query.get(log_id)
+    log = db.session.get(DailyLog, log_id)
     if not log:
         return jsonify({"error": "Daily log not found"}), 404
 
@@ -181,21 +201,28 @@ def get_daily_log(log_id):
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
 
-    return jsonify({"daily_log": log.to_dict()})
+    etag = make_etag(log.id, log.updated_at.timestamp())
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    response = jsonify({"daily_log": log.to_dict()})
+    response.set_etag(etag)
+    return response
 
 
 @daily_logs_bp.route("/<uuid:log_id>", methods=["DELETE"])
 @jwt_required()
 def delete_daily_log(log_id):
     """Delete a daily log."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
 
-    log = DailyLog.query.get(log_id)
+    log = db.session.get(DailyLog, log_id)
     if not log:
         return jsonify({"error": "Daily log not found"}), 404
 
     # Only owner can delete
-    if str(log.user_id) != user_id:
+    if log.user_id != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
     db.session.delete(log)
@@ -208,7 +235,7 @@ def delete_daily_log(log_id):
 @jwt_required()
 def get_suggestions():
     """Get task suggestions for today's log."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
     project_id = request.args.get("project_id")
 
     if not project_id:
@@ -224,13 +251,15 @@ def get_suggestions():
 
 def get_task_suggestions(user_id, project_id):
     """Get suggested tasks based on user's assignments and recent work."""
-    from ..models import CardAssignee, Column, Board
-
     suggestions = []
 
     # Get cards assigned to user in this project
     assigned_cards = (
         Card.query
+        .options(
+            load_only(Card.id, Card.title, Card.priority, Card.story_points, Card.column_id),
+            contains_eager(Card.column).load_only(Column.name),
+        )
         .join(CardAssignee)
         .join(Column)
         .join(Board)
@@ -254,12 +283,7 @@ def get_task_suggestions(user_id, project_id):
         })
 
     # Get cards from yesterday's remaining work
-    yesterday = date.today() - timedelta(days=1)
-    yesterday_log = DailyLog.query.filter_by(
-        user_id=user_id,
-        project_id=project_id,
-        log_date=yesterday
-    ).first()
+    yesterday_log = get_daily_log_days_ago(user_id, project_id, days_ago=1)
 
     if yesterday_log and yesterday_log.remaining_work:
         suggestions.append({
@@ -276,7 +300,7 @@ def get_task_suggestions(user_id, project_id):
 @jwt_required()
 def get_time_summary():
     """Get time tracking summary for a date range."""
-    user_id = get_jwt_identity()
+    user_id = g.user_id
     project_id = request.args.get("project_id")
     days = int(request.args.get("days", 7))
 
@@ -287,25 +311,40 @@ def get_time_summary():
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
 
-    start_date = date.today() - timedelta(days=days)
+    # The window ends at the database's CURRENT_DATE, like get_today_log
+    logs = (
+        select(DailyLog.tasks_worked)
+        .where(
+            DailyLog.user_id == user_id,
+            DailyLog.project_id == project_id,
+            DailyLog.log_date >= func.current_date() - days,
+        )
+        .cte("logs")
+    )
 
-    logs = DailyLog.query.filter(
-        DailyLog.user_id == user_id,
-        DailyLog.project_id == project_id,
-        DailyLog.log_date >= start_date
+    # Unnest tasks_worked and sum time per card in the database. The outer
+    # lateral join keeps logs without tasks; their time lands in the NULL group.
+    task = (
+        func.jsonb_array_elements(logs.c.tasks_worked)
+        .table_valued(column("value", JSONB))
+        .lateral("task")
+    )
+    card_id = task.c.value["card_id"].astext
+    rows = db.session.execute(
+        select(
+            card_id,
+            func.coalesce(func.sum(cast(task.c.value["time_spent"].astext, Integer)), 0),
+            select(func.count()).select_from(logs).scalar_subquery(),
+        )
+        .select_from(logs.outerjoin(task, true()))
+        .group_by(card_id)
     ).all()
 
-    total_time = sum(log.total_time_spent or 0 for log in logs)
-    days_logged = len(logs)
+    total_time = sum(time_spent for _, time_spent, _ in rows)
+    days_logged = rows[0][2] if rows else 0
 
     # Calculate time per card
-    card_times = {}
-    for log in logs:
-        for task in (log.tasks_worked or []):
-            card_id = task.get("card_id")
-            time_spent = task.get("time_spent", 0)
-            if card_id:
-                card_times[card_id] = card_times.get(card_id, 0) + time_spent
+    card_times = {card_id: time_spent for card_id, time_spent, _ in rows if card_id}
 
     return jsonify({
         "summary": {
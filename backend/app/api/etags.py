@@ -0,0 +1,18 @@
+"""ETag helpers for conditional GET endpoints."""
+
+import hashlib
+
+from flask import request
+
+
+def make_etag(*parts):
+    """Hash the values that identify a resource version into a short ETag."""
+    key = ":".join(str(part) for part in parts)
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds etag, else None."""
+    if request.if_none_match.contains(etag):
+        return "", 304, {"ETag": f'"{etag}"'}
+    return None
@@ -1,22 +1,48 @@
 """Health check endpoint."""
 
+import threading
+import time
+
 from flask import Blueprint, jsonify
 from ..extensions import db
 
 health_bp = Blueprint("health", __name__)
 
+# Load balancers poll /health several times a second; probe the database at
+# most once per STATUS_TTL seconds and serve the cached result in between.
+STATUS_TTL = 1.0
+
+_status = {"database": "unknown", "ts": 0.0}
+_probe_lock = threading.Lock()
+
+
+def probe_database():
+    """Run SELECT 1 on a pooled connection, outside any session transaction."""
+    try:
+        conn = db.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        finally:
+            conn.close()
+        return "healthy"
+    except Exception as e:
+        return f"unhealthy: {str(e)}"
+
 
 @health_bp.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    # Check database connection
-    try:
-        db.session.execute(db.text("SELECT 1"))
-        db_status = "healthy"
-    except Exception as e:
-        db_status = f"unhealthy: {str(e)}"
+    # Only one request refreshes a stale status; the rest serve the cached one
+    if time.monotonic() - _status["ts"] >= STATUS_TTL and _probe_lock.acquire(blocking=False):
+        try:
+            _status["database"] = probe_database()
+            _status["ts"] = time.monotonic()
+        finally:
+            _probe_lock.release()
 
     return jsonify({
         "status": "ok",
-        "database": db_status,
+        "database": _status["database"],
     })
@@ -0,0 +1,88 @@
+"""Redis-backed storage for spreadsheet import sessions."""
+
+import orjson
+from flask import current_app
+from redis import Redis
+
+IMPORT_SESSION_TTL = 60 * 60  # Seconds before an abandoned import is discarded
+
+PREVIEW_ROW_COUNT = 20  # Rows kept in the session itself for previews
+
+# Cells Excel parsed as dates are stored as str(value), which is how
+# process_import reads them back anyway.
+SESSION_DUMP_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ImportSessionStore:
+    """Import sessions kept in Redis so every worker sees them.
+
+    Sessions are plain dicts stored as orjson under "import:<id>". Each save
+    resets the session's TTL, so an import expires an hour after it was
+    last touched. Dataclasses (e.g. column analyses) come back as dicts.
+
+    A file's structured rows are kept under their own "import:<id>:rows" key
+    so that polling and preview requests don't decode the whole sheet; the
+    session carries only the first PREVIEW_ROW_COUNT as "preview_rows".
+    """
+
+    def __init__(self, prefix="import:", ttl=IMPORT_SESSION_TTL):
+        self.prefix = prefix
+        self.ttl = ttl
+        self._redis = None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = Redis.from_url(current_app.config["REDIS_URL"])
+        return self._redis
+
+    def get(self, import_id):
+        """Return the session for import_id, or None if it is gone."""
+        raw = self.redis.get(self.prefix + import_id)
+        return orjson.loads(raw) if raw is not None else None
+
+    def exists(self, import_id):
+        """Return whether the session for import_id is still alive."""
+        return bool(self.redis.exists(self.prefix + import_id))
+
+    def get_rows(self, import_id):
+        """Return the structured rows of an import, or [] if there are none."""
+        raw = self.redis.get(self.rows_key(import_id))
+        return orjson.loads(raw) if raw is not None else []
+
+    def create(self, session):
+        """Store a new session under its "id"."""
+        self.redis.set(self.prefix + session["id"], self.dumps(session), ex=self.ttl)
+
+    def save(self, session, rows=None):
+        """Write back a changed session, and its rows if given.
+
+        Returns False without writing if the session was deleted (confirmed,
+        cancelled or expired) in the meantime.
+        """
+        rows_key = self.rows_key(session["id"])
+        if rows is not None:
+            # Rows go first so a session never points at rows not yet written
+            session["preview_rows"] = rows[:PREVIEW_ROW_COUNT]
+            self.redis.set(rows_key, self.dumps(rows), ex=self.ttl)
+
+        if not self.redis.set(self.prefix + session["id"], self.dumps(session), ex=self.ttl, xx=True):
+            self.redis.delete(rows_key)
+            return False
+
+        if rows is None:
+            self.redis.expire(rows_key, self.ttl)
+        return True
+
+    def delete(self, import_id):
+        self.redis.delete(self.prefix + import_id, self.rows_key(import_id))
+
+    def rows_key(self, import_id):
+        return f"{self.prefix}{import_id}:rows"
+
+    @staticmethod
+    def dumps(session):
+        return orjson.dumps(session, default=str, option=SESSION_DUMP_OPTIONS)
+
+
+import_sessions = ImportSessionStore()
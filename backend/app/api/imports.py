@@ -2,47 +2,266 @@
 
 import os
 import csv
-import json
+import logging
 import re
+import time
 import uuid as uuid_lib
-from io import StringIO
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from io import StringIO, TextIOWrapper
+from itertools import chain, islice, pairwise
+from sys import intern
+from typing import Optional
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from werkzeug.utils import secure_filename
 from datetime import datetime
-from openpyxl import load_workbook
+from python_calamine import CalamineWorkbook
+from sqlalchemy import bindparam, func, insert, select
 
 from ..extensions import db
-from ..models import Project, Workspace, OrganizationMember, Card, Column, Board
+from ..models import Card, Column, Board
+from .access import get_project_access
+from .import_store import IMPORT_SESSION_TTL, import_sessions
+from .. import tasks
 from ..services.ai_service import get_ai_service
 
 imports_bp = Blueprint("imports", __name__)
 
+logger = logging.getLogger(__name__)
+
 UPLOAD_FOLDER = os.environ.get("UPLOAD_FOLDER", "uploads")
-ALLOWED_EXTENSIONS = {"xlsx", "xls", "csv"}
+ALLOWED_EXTENSIONS = frozenset({"xlsx", "xls", "csv"})
+CSV_DELIMITERS = (",", ";", "\t", "|")
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_FORM_OVERHEAD = 64 * 1024  # Multipart boundaries and form fields around the file
+HEADER_SCAN_ROWS = 30  # Raw rows read up front for header detection
+ANALYSIS_SAMPLE_ROWS = 30  # Structured rows per column used for content analysis
+
+
+# Cell patterns used by the detection heuristics, compiled once
+PERCENT_RE = re.compile(r"^\d{1,3}%$")
+DURATION_RE = re.compile(r"^\d+\.?\d*\s*(h|hr|hrs|hours?|m|min|mins|minutes?|d|days?|w|weeks?|pts?|points?)$")
+TIME_ESTIMATE_RE = re.compile(r"^\d+\.?\d*\s*(h|hr|hrs|m|min|pts?|points?)$")
+PERSON_NAME_RE = re.compile(r"^[A-Z][a-z]+ [A-Z][a-z]+$")
+NUMBERED_HIERARCHY_RE = re.compile(r"^\d+(\.\d+)*\.?$")
+POINTS_RE = re.compile(r"^(\d+\.?\d*)\s*(pts?|points?|h|hr|hrs|hours?)?")
+# How anything float() accepts (once commas are removed) must start; other
+# cells skip the comma removal and the try/except
+NUMBER_START_RE = re.compile(r"[,\s]*[+-]?[,\s]*[\d.in]", re.IGNORECASE)
+
+# Upper-cased cell values detect_data_type recognizes as priorities / statuses
+PRIORITY_VALUES = frozenset({"P0", "P1", "P2", "P3", "P4", "HIGH", "MEDIUM", "LOW", "CRITICAL"})
+STATUS_VALUES = frozenset({
+    "TODO", "TO DO", "TO-DO", "DONE", "IN PROGRESS", "IN-PROGRESS",
+    "COMPLETE", "COMPLETED", "PENDING", "BLOCKED", "OPEN", "CLOSED",
+    "NOT STARTED", "IN REVIEW", "REVIEW", "QA", "TESTING"
+})
+# Priority values accepted when spotting a priority column by its content
+PRIORITY_COLUMN_VALUES = PRIORITY_VALUES | {"URGENT", "NORMAL"}
+
+# Imported priority values (upper-cased) mapped to card priority levels
+PRIORITY_LEVELS = {
+    "P0": "P0", "P1": "P1", "P2": "P2", "P3": "P3", "P4": "P4",
+    "CRITICAL": "P0", "URGENT": "P0", "HIGHEST": "P0",
+    "HIGH": "P1",
+    "MEDIUM": "P2", "NORMAL": "P2", "MED": "P2",
+    "LOW": "P3",
+    "LOWEST": "P4", "MINOR": "P4",
+}
+
+# Cell strings up to this length are interned when rows are structured
+INTERN_MAX_LENGTH = 32
+
+# Date shapes, each with the strptime formats that can produce it. A cell is
+# matched against one regex and only its shape's formats are tried; %d also
+# accepts a space-padded day, hence the optional spaces.
+DATE_FORMATS_BY_SHAPE = {
+    "dashed": ("%Y-%m-%d", "%d-%m-%Y", "%m-%d-%Y"),
+    "dashed_time": ("%Y-%m-%d %H:%M:%S",),
+    "slashed": ("%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"),
+    "month_first": ("%b %d, %Y", "%B %d, %Y"),
+    "day_first": ("%d %b %Y", "%d %B %Y"),
+}
+DATE_SHAPE_RE = re.compile(
+    r"^(?:(?P<dashed>\d{1,4}- ?\d{1,2}- ?\d{1,4})"
+    r"|(?P<dashed_time>\d{4}-\d{1,2}- ?\d{1,2}\s+\d{1,2}:\d{1,2}:\d{1,2})"
+    r"|(?P<slashed>\d{1,4}/ ?\d{1,2}/ ?\d{1,4})"
+    r"|(?P<month_first>[A-Za-z]+\s+ ?\d{1,2},\s+\d{4})"
+    r"|(?P<day_first>\d{1,2}\s+[A-Za-z]+\s+\d{4}))$"
+)
+
+# Words that strongly indicate a header row
+HEADER_ROW_KEYWORDS = frozenset({
+    "task", "title", "name", "description", "status", "priority",
+    "assignee", "owner", "responsible", "date", "due", "deadline",
+    "estimate", "points", "hours", "effort", "start", "end",
+    "id", "number", "type", "category", "label", "tag", "notes",
+    "comment", "progress", "completion", "phase", "stage", "column"
+})
+# One alternation scans a cell for all keywords at once
+HEADER_ROW_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, sorted(HEADER_ROW_KEYWORDS, key=len, reverse=True)))
+)
+# A header row scoring at least HEADER_SCORE_CONFIDENT and beating every
+# earlier row by more than HEADER_SCORE_MARGIN ends the header scan
+HEADER_SCORE_CONFIDENT = 70
+HEADER_SCORE_MARGIN = 20
+
+# Header keywords per mappable field, in priority order. Single words also
+# match their plural/past forms ("tags", "estimated"); two-word keywords
+# match adjacent words in the header.
+HEADER_FIELD_KEYWORDS = {
+    "title": ("title", "name", "task", "item", "issue", "ticket", "summary", "subject", "todo", "card", "work item"),
+    "description": ("description", "desc", "detail", "details", "body", "content", "notes", "note", "comment", "remarks"),
+    "priority": ("priority", "prio", "urgency", "importance", "severity", "p0", "p1", "p2", "level"),
+    "story_points": ("point", "points", "story point", "estimate", "effort", "size", "sp", "complexity", "hrs", "hours", "plan"),
+    "assignee": ("assignee", "assigned", "owner", "responsible", "user", "person", "member", "resource"),
+    "status": ("status", "state", "stage", "column", "progress", "phase"),
+    "due_date": ("due", "deadline", "end", "target", "finish", "complete by"),
+    "start_date": ("start", "begin", "created"),
+    "labels": ("label", "tag", "category", "categories", "type", "kind", "group", "epic", "theme"),
+}
+
+
+def build_header_keyword_index():
+    """Map each header word to the (field, priority) pairs it signals."""
+    index = {}
+    for field_name, keywords in HEADER_FIELD_KEYWORDS.items():
+        for rank, keyword in enumerate(keywords):
+            if " " in keyword:
+                variants = {keyword}
+            else:
+                variants = {keyword, keyword + "s", keyword + "es", keyword + "d", keyword + "ed"}
+            for variant in variants:
+                index.setdefault(variant, []).append((field_name, rank))
+    return index
+
+
+HEADER_KEYWORD_INDEX = build_header_keyword_index()
+
+# Tool exports with fixed column names: (identifying headers, field mapping),
+# all lowercase. A file containing every identifying header is mapped directly.
+KNOWN_EXPORT_MAPPINGS = {
+    "jira": (
+        {"summary", "issue key", "issue type"},
+        {
+            "title": "summary", "description": "description", "priority": "priority",
+            "story_points": "custom field (story points)", "assignee": "assignee",
+            "status": "status", "due_date": "due date", "labels": "labels",
+        },
+    ),
+    "linear": (
+        {"id", "team", "title", "status"},
+        {
+            "title": "title", "description": "description", "priority": "priority",
+            "story_points": "estimate", "assignee": "assignee", "status": "status",
+            "due_date": "due date", "labels": "labels",
+        },
+    ),
+    "trello": (
+        {"card name", "list name"},
+        {
+            "title": "card name", "description": "card description", "assignee": "members",
+            "status": "list name", "due_date": "due date", "labels": "labels",
+        },
+    ),
+    "asana": (
+        {"task id", "name", "section/column"},
+        {
+            "title": "name", "description": "notes", "assignee": "assignee",
+            "status": "section/column", "due_date": "due date", "start_date": "start date",
+            "labels": "tags",
+        },
+    ),
+}
+# Header words, also split at camel-case humps: "DueDate" -> "Due", "Date"
+HEADER_WORD_RE = re.compile(r"[A-Z]+[0-9]*(?![a-z])|[A-Z]?[a-z]+[0-9]*|[0-9]+")
+# Keywords without spaces, for finding them inside joined words ("storypoints").
+# Three-letter keywords only count at the start of a word ("duedate", not
+# "spend"), and shorter ones ("sp", "p0") never inside one.
+HEADER_KEYWORD_SUBSTRINGS = tuple(
+    (keyword.replace(" ", ""), field, rank)
+    for field, keywords in HEADER_FIELD_KEYWORDS.items()
+    for rank, keyword in enumerate(keywords)
+    if len(keyword) >= 3
+)
+
+# Lowercase cell values that mark a column as a status column
+COLUMN_STATUS_VALUES = frozenset({
+    "todo", "done", "in progress", "complete", "pending", "blocked", "open", "closed"
+})
+
+
+def file_extension(filename):
+    """Return the lowercased extension of a filename, or "" if it has none."""
+    return filename.rsplit(".", 1)[1].lower() if "." in filename else ""
+
+
+def expire_import_files(upload_dir):
+    """Remove uploaded files whose import session has expired in Redis.
+
+    Sessions expire on their own, an hour after they were last saved. A file
+    older than that is removed once its session ("<import_id>.<ext>") is gone;
+    a file of a session still in use is kept however old it is.
+    """
+    cutoff = time.time() - IMPORT_SESSION_TTL
+    with os.scandir(upload_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.stat().st_mtime >= cutoff:
+                continue
+            if import_sessions.exists(entry.name.split(".", 1)[0]):
+                continue
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Removed by another worker
+
+
+def read_raw_head(session, limit):
+    """Re-read the first raw rows of an import's saved file, or [] if it is gone."""
+    if not os.path.exists(session["file_path"]):
+        return []
+    raw_head, _ = parse_raw(session["file_path"], session["file_type"], prefetch=limit)
+    return raw_head
+
 
-# In-memory storage for import sessions (in production, use Redis or database)
-import_sessions = {}
+class SampleCell:
+    """A cell value with its string forms computed once for the analyzers."""
 
+    __slots__ = ("value", "text", "stripped", "lower")
 
-def allowed_file(filename):
-    """Check if file extension is allowed."""
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    def __init__(self, value):
+        self.value = value
+        self.text = "" if value is None else str(value)
+        self.stripped = self.text.strip()
+        self.lower = self.stripped.lower()
 
 
-def check_project_access(project_id, user_id):
-    """Check if user has access to project."""
-    project = Project.query.get(project_id)
-    if not project:
-        return None, None
+def normalize_sample(headers, rows, size=ANALYSIS_SAMPLE_ROWS):
+    """Wrap the first `size` rows in SampleCells, laid out column by column.
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    Returns {header: [cell, ...]} so the analyzers read each column as one
+    list. Missing cells (short rows) are treated like empty ones.
+    """
+    sample_rows = rows[:size]
+    return {header: [SampleCell(row.get(header)) for row in sample_rows] for header in headers}
 
-    return project, membership
+
+@lru_cache(maxsize=4096)
+def is_date(value_str):
+    """Check whether a string parses with one of the supported date formats."""
+    match = DATE_SHAPE_RE.match(value_str)
+    if not match:
+        return False
+
+    for pattern in DATE_FORMATS_BY_SHAPE[match.lastgroup]:
+        try:
+            datetime.strptime(value_str, pattern)
+            return True
+        except ValueError:
+            continue
+    return False
 
 
 def detect_data_type(value, context_hint=None):
@@ -50,58 +269,51 @@ def detect_data_type(value, context_hint=None):
     if value is None or value == "":
         return "empty"
 
-    value_str = str(value).strip()
+    return detect_text_type(str(value).strip(), context_hint)
+
+
+def detect_text_type(value_str, context_hint=None):
+    """Detect the data type of an already stripped cell string."""
+    value_upper = value_str.upper()
 
     # Check for priority patterns
-    if value_str.upper() in ["P0", "P1", "P2", "P3", "P4", "HIGH", "MEDIUM", "LOW", "CRITICAL"]:
+    if value_upper in PRIORITY_VALUES:
         return "priority"
 
     # Check for status patterns
-    status_keywords = {
-        "TODO", "TO DO", "TO-DO", "DONE", "IN PROGRESS", "IN-PROGRESS",
-        "COMPLETE", "COMPLETED", "PENDING", "BLOCKED", "OPEN", "CLOSED",
-        "NOT STARTED", "IN REVIEW", "REVIEW", "QA", "TESTING"
-    }
-    if value_str.upper() in status_keywords:
+    if value_upper in STATUS_VALUES:
         return "status"
 
     # Check for percentage (completion)
-    if re.match(r"^\d{1,3}%$", value_str):
+    if PERCENT_RE.match(value_str):
         return "percentage"
 
     # Check for time/duration patterns (2h, 30m, 2.5hrs, etc.)
-    if re.match(r"^\d+\.?\d*\s*(h|hr|hrs|hours?|m|min|mins|minutes?|d|days?|w|weeks?|pts?|points?)$", value_str.lower()):
+    if DURATION_RE.match(value_str.lower()):
         return "duration"
 
     # Check for number
-    try:
-        num = float(value_str.replace(",", ""))
-        # If context hint suggests this is a row number, mark it
-        if context_hint == "row_identifier" and num == int(num) and 1 <= num <= 1000:
-            return "row_identifier"
-        return "number"
-    except ValueError:
-        pass
-
-    # Check for date with multiple patterns
-    date_patterns = [
-        "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d",
-        "%d-%m-%Y", "%m-%d-%Y", "%b %d, %Y", "%B %d, %Y",
-        "%d %b %Y", "%d %B %Y", "%Y-%m-%d %H:%M:%S"
-    ]
-    for pattern in date_patterns:
+    if NUMBER_START_RE.match(value_str):
         try:
-            datetime.strptime(value_str, pattern)
-            return "date"
+            num = float(value_str.replace(",", ""))
+            # If context hint suggests this is a row number, mark it
+            if context_hint == "row_identifier" and num == int(num) and 1 <= num <= 1000:
+                return "row_identifier"
+            return "number"
         except ValueError:
-            continue
+            pass
 
-    # Check for email
-    if "@" in value_str and "." in value_str.split("@")[-1]:
+    # Check for date
+    if is_date(value_str):
+        return "date"
+
+    # Check for email (a "." after the last "@")
+    at = value_str.rfind("@")
+    if at != -1 and value_str.find(".", at) != -1:
         return "email"
 
     # Check for person name pattern (First Last, initials, etc.)
-    if context_hint == "person" and re.match(r"^[A-Z][a-z]+ [A-Z][a-z]+$", value_str):
+    if context_hint == "person" and PERSON_NAME_RE.match(value_str):
         return "person"
 
     # Default to text
@@ -119,23 +331,12 @@ def calculate_header_score(row, row_idx):
     if len(non_empty_cells) < 2:
         return -1
 
-    # Header keywords that strongly indicate a header row
-    header_keywords = {
-        "task", "title", "name", "description", "status", "priority",
-        "assignee", "owner", "responsible", "date", "due", "deadline",
-        "estimate", "points", "hours", "effort", "start", "end",
-        "id", "number", "type", "category", "label", "tag", "notes",
-        "comment", "progress", "completion", "phase", "stage", "column"
-    }
-
     for cell in non_empty_cells:
         cell_str = str(cell).lower().strip()
 
         # Check for header keywords
-        for keyword in header_keywords:
-            if keyword in cell_str:
-                score += 20
-                break
+        if HEADER_ROW_KEYWORD_RE.search(cell_str):
+            score += 20
 
         # Headers are usually short
         if 2 <= len(cell_str) <= 30:
@@ -170,17 +371,21 @@ def detect_header_row(raw_rows, max_check=15):
     best_row_idx = 0
     best_score = -1
 
-    # Check first N rows to find the best header candidate
+    # Check first N rows to find the best header candidate, stopping early
+    # once a row scores clearly above everything before it
     for idx, row in enumerate(raw_rows[:max_check]):
         score = calculate_header_score(row, idx)
         if score > best_score:
+            confident = score >= HEADER_SCORE_CONFIDENT and score > best_score + HEADER_SCORE_MARGIN
             best_score = score
             best_row_idx = idx
+            if confident:
+                break
 
     return best_row_idx, raw_rows[best_row_idx] if best_row_idx < len(raw_rows) else []
 
 
-def detect_hierarchical_structure(rows, headers):
+def detect_hierarchical_structure(sample, headers):
     """Detect if the data has a hierarchical structure (parent/child tasks)."""
     structure = {
         "is_hierarchical": False,
@@ -190,22 +395,23 @@ def detect_hierarchical_structure(rows, headers):
         "hierarchy_pattern": None
     }
 
-    if not rows or not headers:
+    if not headers or not any(sample.values()):
         return structure
 
+    headers_lower = [header.lower() for header in headers]
+
     # Look for ID columns (columns with sequential numbers 1, 2, 3...)
     for header in headers:
-        values = [row.get(header) for row in rows[:20] if row.get(header) is not None]
+        values = [cell.stripped for cell in sample[header][:20] if cell.value is not None]
         if not values:
             continue
 
         # Check for sequential integers
         try:
-            int_values = [int(float(str(v))) for v in values if str(v).strip()]
+            int_values = [int(float(v)) for v in values if v]
             if len(int_values) >= 3:
                 # Check if mostly sequential
-                sequential_count = sum(1 for i in range(1, len(int_values))
-                                       if int_values[i] == int_values[i-1] + 1)
+                sequential_count = sum(b - a == 1 for a, b in pairwise(int_values))
                 if sequential_count >= len(int_values) * 0.5:
                     structure["id_column"] = header
                     break
@@ -214,8 +420,7 @@ def detect_hierarchical_structure(rows, headers):
 
     # Look for parent ID columns
     parent_patterns = ["parent", "parent_id", "parent id", "parent task", "depends on", "subtask of"]
-    for header in headers:
-        header_lower = header.lower()
+    for header, header_lower in zip(headers, headers_lower):
         for pattern in parent_patterns:
             if pattern in header_lower:
                 structure["parent_column"] = header
@@ -223,9 +428,9 @@ def detect_hierarchical_structure(rows, headers):
                 break
 
     # Check for indentation-based hierarchy (text starting with spaces/dashes)
-    for header in headers:
-        if "task" in header.lower() or "title" in header.lower() or "name" in header.lower():
-            values = [str(row.get(header, "")) for row in rows[:20]]
+    for header, header_lower in zip(headers, headers_lower):
+        if "task" in header_lower or "title" in header_lower or "name" in header_lower:
+            values = [cell.text for cell in sample[header][:20]]
             indented_count = sum(1 for v in values if v.startswith("  ") or v.startswith("-") or v.startswith("•"))
             if indented_count >= 3:
                 structure["is_hierarchical"] = True
@@ -234,9 +439,9 @@ def detect_hierarchical_structure(rows, headers):
 
     # Check for numbering hierarchy (1, 1.1, 1.2, 2, 2.1, etc.)
     for header in headers:
-        values = [str(row.get(header, "")) for row in rows[:30]]
+        values = [cell.stripped for cell in sample[header][:30]]
         # Pattern for hierarchical numbering
-        numbered_count = sum(1 for v in values if re.match(r"^\d+(\.\d+)*\.?$", v.strip()))
+        numbered_count = sum(1 for v in values if NUMBERED_HIERARCHY_RE.match(v))
         if numbered_count >= 5:
             structure["is_hierarchical"] = True
             structure["hierarchy_pattern"] = "numbered"
@@ -247,25 +452,25 @@ def detect_hierarchical_structure(rows, headers):
     return structure
 
 
-def detect_adjacent_content_columns(headers, rows, data_types):
+def detect_adjacent_content_columns(headers, sample, data_types, adjacent_stats=None):
     """Detect when title content is split across adjacent columns."""
+    if adjacent_stats is None:
+        adjacent_stats = analyze_columns(headers, sample)[2]
+
     adjacent_pairs = []
 
     for i, header in enumerate(headers[:-1]):
         next_header = headers[i + 1]
 
         # Check if first column has short content (numbers, IDs) and next has longer text
-        col1_values = [str(row.get(header, "")) for row in rows[:15] if row.get(header)]
-        col2_values = [str(row.get(next_header, "")) for row in rows[:15] if row.get(next_header)]
+        col1_stats = adjacent_stats.get(header)
+        col2_stats = adjacent_stats.get(next_header)
 
-        if not col1_values or not col2_values:
+        if not col1_stats or not col2_stats:
             continue
 
-        col1_avg_len = sum(len(v) for v in col1_values) / len(col1_values)
-        col2_avg_len = sum(len(v) for v in col2_values) / len(col2_values)
-
-        # Check if col1 is numeric/short and col2 is longer text
-        col1_numeric = all(v.replace(".", "").replace("-", "").isdigit() for v in col1_values if v.strip())
+        col1_avg_len, col1_numeric = col1_stats
+        col2_avg_len, _ = col2_stats
 
         if col1_numeric and col1_avg_len < 10 and col2_avg_len > 20:
             # This looks like ID + Description pattern
@@ -321,140 +526,274 @@ def smart_generate_title(row, mapping, adjacent_pairs):
 
 def analyze_column_patterns(headers, rows):
     """Deep analysis of column content patterns for better detection."""
-    analysis = {}
+    return analyze_columns(headers, normalize_sample(headers, rows))[0]
+
+
+def analyze_columns(headers, sample):
+    """Analyze every column of the normalized sample (see normalize_sample).
+
+    Returns (column_analysis, data_types, adjacent_stats). data_types is the
+    most common detect_data_type() of the first 15 non-empty values, and
+    adjacent_stats maps each header to (avg_length, is_numeric) of those same
+    values, or None if there are none.
+    """
+    column_analysis = {}
+    data_types = {}
+    adjacent_stats = {}
 
     for header in headers:
-        values = [row.get(header) for row in rows[:30] if row.get(header) is not None]
-        if not values:
-            analysis[header] = {"type": "empty", "confidence": 1.0}
-            continue
+        column_analysis[header], data_types[header], adjacent_stats[header] = analyze_column(
+            sample[header]
+        )
 
-        str_values = [str(v).strip() for v in values]
-        non_empty = [v for v in str_values if v]
+    return column_analysis, data_types, adjacent_stats
 
-        if not non_empty:
-            analysis[header] = {"type": "empty", "confidence": 1.0}
-            continue
 
-        # Analyze patterns
-        avg_len = sum(len(v) for v in non_empty) / len(non_empty)
-        unique_ratio = len(set(non_empty)) / len(non_empty)
+def analyze_column(column):
+    """Analyze one column's sample cells in a single pass.
 
-        # Check for sequential numbers
-        try:
-            nums = [int(float(v)) for v in non_empty if v.replace(".", "").replace("-", "").isdigit()]
-            if len(nums) >= 3 and len(nums) / len(non_empty) > 0.8:
-                is_sequential = all(nums[i] == nums[i-1] + 1 for i in range(1, len(nums)))
-                if is_sequential:
-                    analysis[header] = {
-                        "type": "sequential_id",
-                        "confidence": 0.95,
-                        "sample": nums[:5]
-                    }
-                    continue
-        except (ValueError, TypeError):
-            pass
+    Returns (analysis, data_type, adjacent_stats) for analyze_columns.
+    """
+    cells = []
+    total_len = 0
+    distinct = set()
+    type_counts = Counter()
+    adjacent_total = adjacent_count = 0
+    adjacent_numeric = True
 
-        # Check for status values
-        status_keywords = {"todo", "done", "in progress", "complete", "pending", "blocked", "open", "closed"}
-        status_matches = sum(1 for v in non_empty if v.lower() in status_keywords)
-        if status_matches / len(non_empty) > 0.5:
-            analysis[header] = {"type": "status", "confidence": status_matches / len(non_empty)}
+    for idx, cell in enumerate(column):
+        if cell.value is None:
             continue
+        if cell.stripped:
+            cells.append(cell)
+            total_len += len(cell.stripped)
+            distinct.add(cell.stripped)
+
+        if idx < 15 and cell.value:
+            type_counts[detect_text_type(cell.stripped)] += 1
+            adjacent_total += len(cell.text)
+            adjacent_count += 1
+            if cell.stripped and not cell.text.replace(".", "").replace("-", "").isdigit():
+                adjacent_numeric = False
+
+    data_type = type_counts.most_common(1)[0][0] if type_counts else "text"
+    adjacent_stats = (adjacent_total / adjacent_count, adjacent_numeric) if adjacent_count else None
+    return classify_column(cells, total_len, len(distinct)), data_type, adjacent_stats
+
+
+@dataclass(slots=True)
+class ColumnAnalysis:
+    """What a column's sample content looks like.
+
+    Serialized as-is in import structures; fields that don't apply to the
+    detected type are None.
+    """
+
+    type: str
+    confidence: float
+    avg_length: Optional[float] = None
+    unique_ratio: Optional[float] = None
+    sample: Optional[list] = None
+
+
+def classify_column(cells, total_len, distinct_count):
+    """Classify a column from its non-empty sample cells.
+
+    total_len and distinct_count (of the stripped values) are accumulated by
+    the caller while it collects the cells.
+    """
+    if not cells:
+        return ColumnAnalysis("empty", 1.0)
+
+    # Analyze patterns with column-at-a-time builtins rather than per-value Python loops
+    non_empty = [cell.stripped for cell in cells]
+    lowered = [cell.lower for cell in cells]
+    count = len(non_empty)
+    avg_len = total_len / count
+    unique_ratio = distinct_count / count
+
+    # Check for sequential numbers
+    try:
+        nums = [int(float(v)) for v in non_empty if v.replace(".", "").replace("-", "").isdigit()]
+        if len(nums) >= 3 and len(nums) / len(non_empty) > 0.8:
+            is_sequential = all(b - a == 1 for a, b in pairwise(nums))
+            if is_sequential:
+                return ColumnAnalysis("sequential_id", 0.95, sample=nums[:5])
+    except (ValueError, TypeError):
+        pass
 
-        # Check for names (person names)
-        name_pattern = sum(1 for v in non_empty if re.match(r"^[A-Z][a-z]+ [A-Z][a-z]+$", v))
-        if name_pattern / len(non_empty) > 0.5:
-            analysis[header] = {"type": "person_name", "confidence": name_pattern / len(non_empty)}
-            continue
+    # Check for status values
+    status_matches = sum(map(COLUMN_STATUS_VALUES.__contains__, lowered))
+    if status_matches / count > 0.5:
+        return ColumnAnalysis("status", status_matches / count)
 
-        # Check for time estimates (2h, 16 pts, etc.)
-        time_pattern = sum(1 for v in non_empty if re.match(r"^\d+\.?\d*\s*(h|hr|hrs|m|min|pts?|points?)$", v.lower()))
-        if time_pattern / len(non_empty) > 0.4:
-            analysis[header] = {"type": "time_estimate", "confidence": time_pattern / len(non_empty)}
-            continue
+    # Check for names (person names)
+    name_pattern = sum(1 for _ in filter(PERSON_NAME_RE.match, non_empty))
+    if name_pattern / count > 0.5:
+        return ColumnAnalysis("person_name", name_pattern / count)
 
-        # Determine if this is likely a title column
-        if 10 < avg_len < 150 and unique_ratio > 0.7:
-            analysis[header] = {
-                "type": "title_candidate",
-                "confidence": unique_ratio * 0.8,
-                "avg_length": avg_len
-            }
-        elif avg_len > 100:
-            analysis[header] = {
-                "type": "description_candidate",
-                "confidence": 0.8,
-                "avg_length": avg_len
-            }
-        else:
-            analysis[header] = {
-                "type": "text",
-                "confidence": 0.5,
-                "avg_length": avg_len,
-                "unique_ratio": unique_ratio
-            }
+    # Check for time estimates (2h, 16 pts, etc.)
+    time_pattern = sum(1 for _ in filter(TIME_ESTIMATE_RE.match, lowered))
+    if time_pattern / count > 0.4:
+        return ColumnAnalysis("time_estimate", time_pattern / count)
+
+    # Determine if this is likely a title column
+    if 10 < avg_len < 150 and unique_ratio > 0.7:
+        return ColumnAnalysis("title_candidate", unique_ratio * 0.8, avg_length=avg_len)
+    elif avg_len > 100:
+        return ColumnAnalysis("description_candidate", 0.8, avg_length=avg_len)
+    else:
+        return ColumnAnalysis("text", 0.5, avg_length=avg_len, unique_ratio=unique_ratio)
+
+
+def parse_excel_raw(source, prefetch=HEADER_SCAN_ROWS):
+    """Parse the first sheet of an Excel file (xlsx or xls) with calamine.
 
-    return analysis
+    source is a file path or a binary file object. Returns (prefix_rows, rest):
+    the first `prefetch` rows as lists, which is all header detection needs,
+    and an iterator over the remaining rows.
+    """
+    workbook = CalamineWorkbook.from_object(source)
+    sheet = workbook.get_sheet_by_index(0)
 
+    def iter_rows():
+        # Keep leading blank rows so row numbers match what users see in Excel
+        for row in sheet.to_python(skip_empty_area=False):
+            yield [excel_cell_value(value) for value in row]
 
-def parse_excel_raw(file_path):
-    """Parse Excel file and return ALL rows including potential header rows."""
-    wb = load_workbook(file_path, read_only=True)
-    sheet = wb.active
+    rows = iter_rows()
+    return list(islice(rows, prefetch)), rows
 
-    all_rows = []
-    for row in sheet.iter_rows(values_only=True):
-        all_rows.append(list(row))
 
-    wb.close()
-    return all_rows
+def excel_cell_value(value):
+    """Normalize a calamine cell to what the detectors expect.
 
+    Empty cells become None and whole-number floats become ints, since Excel
+    stores every number as a float ("1" would otherwise read as "1.0").
+    """
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def detect_csv_delimiter(sample):
+    """Pick the delimiter whose per-line count is the most consistent.
+
+    A cheap frequency count over the sample lines; each candidate is scored by
+    how many lines share its most common non-zero count, then by its total.
+    The last line is ignored since the sample may cut it short.
+    """
+    lines = sample.splitlines()
+    lines = [line for line in lines[:-1] or lines if line.strip()]
+
+    best_delimiter, best_score = ",", (0, 0)
+    for delimiter in CSV_DELIMITERS:
+        counts = [line.count(delimiter) for line in lines]
+        modes = Counter(count for count in counts if count)
+        if not modes:
+            continue
+        score = (modes.most_common(1)[0][1], sum(counts))
+        if score > best_score:
+            best_delimiter, best_score = delimiter, score
+
+    return best_delimiter
 
-def parse_csv_raw(file_path):
-    """Parse CSV file and return ALL rows including potential header rows."""
-    all_rows = []
-    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-        # Try to detect dialect
-        sample = f.read(4096)
-        f.seek(0)
 
+def parse_csv_raw(source, prefetch=HEADER_SCAN_ROWS):
+    """Parse a CSV file lazily, including potential header rows.
+
+    source is a file path or a binary file object, which is left open.
+    Returns (prefix_rows, rest) like parse_excel_raw.
+    """
+    def iter_rows():
+        binary = open(source, "rb") if isinstance(source, str) else source
+        f = TextIOWrapper(binary, encoding="utf-8", errors="replace")
         try:
-            dialect = csv.Sniffer().sniff(sample)
-        except csv.Error:
-            dialect = csv.excel
+            # Detect the delimiter from the first 4 KB
+            sample = f.read(4096)
+            f.seek(0)
+
+            yield from csv.reader(f, delimiter=detect_csv_delimiter(sample))
+        finally:
+            f.detach()
+            if binary is not source:
+                binary.close()
+
+    rows = iter_rows()
+    return list(islice(rows, prefetch)), rows
 
-        reader = csv.reader(f, dialect=dialect)
-        for row in reader:
-            all_rows.append(row)
 
-    return all_rows
+def parse_raw(source, file_type, prefetch=HEADER_SCAN_ROWS):
+    """Parse an uploaded file (path or binary file object) into (prefix_rows, rest)."""
+    if file_type in ["xlsx", "xls"]:
+        return parse_excel_raw(source, prefetch)
+    return parse_csv_raw(source, prefetch)
 
 
 def process_raw_to_structured(raw_rows, header_row_idx):
-    """Convert raw rows to structured data with detected headers."""
-    if header_row_idx >= len(raw_rows):
+    """Convert raw rows to structured data with detected headers.
+
+    raw_rows may be any iterable, so rows can be streamed straight from the
+    parser without materializing the whole sheet first.
+    """
+    raw_iter = iter(raw_rows)
+    header_row = next(islice(raw_iter, header_row_idx, None), None)
+    if header_row is None:
         return [], []
 
-    header_row = raw_rows[header_row_idx]
     headers = [str(cell) if cell else f"Column {i+1}" for i, cell in enumerate(header_row)]
 
     rows = []
-    for row in raw_rows[header_row_idx + 1:]:
+    for row in raw_iter:
         # Skip empty rows
         if all(cell is None or str(cell).strip() == "" for cell in row):
             continue
 
+        # Short strings (statuses, priorities, names) repeat down a column;
+        # interning keeps one copy of each for the life of the session
         row_dict = {}
         for i, cell in enumerate(row):
             if i < len(headers):
+                if isinstance(cell, str) and len(cell) <= INTERN_MAX_LENGTH:
+                    cell = intern(cell)
                 row_dict[headers[i]] = cell
         rows.append(row_dict)
 
     return headers, rows
 
 
-def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None):
+def header_field_candidates(headers):
+    """Rank headers for each field by the keywords in their names.
+
+    Each header is split into words once and the words (and adjacent word
+    pairs) are looked up in HEADER_KEYWORD_INDEX. A word with no entry of its
+    own, such as "storypoints", is searched for keywords as a substring, the
+    way whole headers used to be. Returns {field: [header, ...]} ordered by
+    keyword priority, then by column order.
+    """
+    ranked = {}
+    for idx, header in enumerate(headers):
+        words = [word.lower() for word in HEADER_WORD_RE.findall(header)]
+        pairs = [f"{first} {second}" for first, second in zip(words, words[1:])]
+        for word in words:
+            if word in HEADER_KEYWORD_INDEX:
+                hits = HEADER_KEYWORD_INDEX[word]
+            else:
+                hits = [
+                    (field_name, rank) for keyword, field_name, rank in HEADER_KEYWORD_SUBSTRINGS
+                    if word.startswith(keyword) or (len(keyword) > 3 and keyword in word)
+                ]
+            for field_name, rank in hits:
+                ranked.setdefault(field_name, []).append((rank, idx, header))
+        for pair in pairs:
+            for field_name, rank in HEADER_KEYWORD_INDEX.get(pair, ()):
+                ranked.setdefault(field_name, []).append((rank, idx, header))
+    return {field_name: [header for _, _, header in sorted(hits)] for field_name, hits in ranked.items()}
+
+
+def smart_detect_column_mapping(headers, sample, data_types, column_analysis=None):
     """AI-like smart detection of column mappings with advanced pattern recognition."""
     mapping = {
         "title": None,
@@ -469,26 +808,30 @@ def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None)
         "estimate": None,
     }
 
-    headers_lower = {h.lower().strip(): h for h in headers}
-    column_analysis = column_analysis or analyze_column_patterns(headers, rows)
+    # Known tool exports skip the heuristics entirely
+    known_mapping = known_export_mapping(headers)
+    if known_mapping:
+        mapping.update(known_mapping)
+        return mapping, *mapping_confidence(mapping)
+
+    candidates = header_field_candidates(headers)
+    column_analysis = column_analysis or analyze_columns(headers, sample)[0]
+
+    # Non-empty cells among each column's first 15, shared by the content fallbacks
+    head_cells = {header: [cell for cell in sample[header][:15] if cell.value] for header in headers}
 
     # ============ TITLE DETECTION ============
-    # Method 1: Look for explicit title patterns
-    title_patterns = ["title", "name", "task", "item", "issue", "ticket", "summary", "subject", "todo", "card", "work item"]
-    for pattern in title_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower and "description" not in h_lower:
-                mapping["title"] = h_orig
-                break
-        if mapping["title"]:
-            break
+    # Method 1: Look for explicit title keywords
+    mapping["title"] = next(
+        (h for h in candidates.get("title", ()) if "description" not in h.lower()), None
+    )
 
     # Method 2: Use column analysis to find best title candidate
     if not mapping["title"]:
         best_title_score = 0
         for header, analysis in column_analysis.items():
-            if analysis.get("type") == "title_candidate":
-                score = analysis.get("confidence", 0)
+            if analysis.type == "title_candidate":
+                score = analysis.confidence
                 if score > best_title_score:
                     best_title_score = score
                     mapping["title"] = header
@@ -497,24 +840,19 @@ def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None)
     if not mapping["title"]:
         for header in headers:
             if data_types.get(header) == "text":
-                sample_values = [str(row.get(header, "")) for row in rows[:15] if row.get(header)]
+                sample_values = [cell.text for cell in head_cells[header]]
                 if not sample_values:
                     continue
-                avg_len = sum(len(v) for v in sample_values) / len(sample_values)
-                unique_ratio = len(set(sample_values)) / len(sample_values) if sample_values else 0
+                avg_len = sum(map(len, sample_values)) / len(sample_values)
+                unique_ratio = len(set(sample_values)) / len(sample_values)
                 if 5 < avg_len < 200 and unique_ratio > 0.7:
                     mapping["title"] = header
                     break
 
     # ============ DESCRIPTION DETECTION ============
-    desc_patterns = ["description", "desc", "detail", "details", "body", "content", "notes", "note", "comment", "remarks"]
-    for pattern in desc_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower and h_orig != mapping["title"]:
-                mapping["description"] = h_orig
-                break
-        if mapping["description"]:
-            break
+    mapping["description"] = next(
+        (h for h in candidates.get("description", ()) if h != mapping["title"]), None
+    )
 
     # Find longest text column as description
     if not mapping["description"]:
@@ -522,46 +860,31 @@ def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None)
         for header in headers:
             if header == mapping["title"]:
                 continue
-            analysis = column_analysis.get(header, {})
-            if analysis.get("type") in ["description_candidate", "text"]:
-                avg_len = analysis.get("avg_length", 0)
+            analysis = column_analysis.get(header)
+            if analysis and analysis.type in ["description_candidate", "text"]:
+                avg_len = analysis.avg_length
                 if avg_len > max_avg_len and avg_len > 30:
                     max_avg_len = avg_len
                     mapping["description"] = header
 
     # ============ PRIORITY DETECTION ============
-    prio_patterns = ["priority", "prio", "urgency", "importance", "severity", "p0", "p1", "p2", "level"]
-    for pattern in prio_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["priority"] = h_orig
-                break
-        if mapping["priority"]:
-            break
+    mapping["priority"] = next(iter(candidates.get("priority", ())), None)
 
     # Check content for priority values
     if not mapping["priority"]:
         for header in headers:
-            sample_values = [str(row.get(header, "")).upper().strip() for row in rows[:15] if row.get(header)]
-            priority_keywords = {"P0", "P1", "P2", "P3", "P4", "HIGH", "MEDIUM", "LOW", "CRITICAL", "URGENT", "NORMAL"}
-            if sample_values and sum(1 for v in sample_values if v in priority_keywords) / len(sample_values) > 0.4:
+            cells = head_cells[header]
+            if cells and sum(cell.stripped.upper() in PRIORITY_COLUMN_VALUES for cell in cells) / len(cells) > 0.4:
                 mapping["priority"] = header
                 break
 
     # ============ STORY POINTS / ESTIMATE DETECTION ============
-    points_patterns = ["point", "points", "story_point", "estimate", "effort", "size", "sp", "complexity", "hrs", "hours", "plan"]
-    for pattern in points_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["story_points"] = h_orig
-                break
-        if mapping["story_points"]:
-            break
+    mapping["story_points"] = next(iter(candidates.get("story_points", ())), None)
 
     # Check column analysis for time estimates
     if not mapping["story_points"]:
         for header, analysis in column_analysis.items():
-            if analysis.get("type") == "time_estimate":
+            if analysis.type == "time_estimate":
                 mapping["story_points"] = header
                 mapping["estimate"] = header
                 break
@@ -572,81 +895,71 @@ def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None)
         for header in headers:
             if data_types.get(header) == "number":
                 sample_values = []
-                for row in rows[:15]:
+                for cell in sample[header][:15]:
+                    # Empty and text cells never reach float()
+                    if not NUMBER_START_RE.match(cell.text):
+                        continue
                     try:
-                        val = int(float(str(row.get(header, 0))))
-                        sample_values.append(val)
-                    except:
+                        sample_values.append(int(float(cell.text)))
+                    except (ValueError, OverflowError):
                         pass
                 if sample_values and all(v in fibonacci_like or 0 <= v <= 21 for v in sample_values):
                     mapping["story_points"] = header
                     break
 
     # ============ ASSIGNEE DETECTION ============
-    assignee_patterns = ["assignee", "assigned", "owner", "responsible", "user", "person", "member", "resource"]
-    for pattern in assignee_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["assignee"] = h_orig
-                break
-        if mapping["assignee"]:
-            break
+    mapping["assignee"] = next(iter(candidates.get("assignee", ())), None)
 
     # Check for person name columns
     if not mapping["assignee"]:
         for header, analysis in column_analysis.items():
-            if analysis.get("type") == "person_name":
+            if analysis.type == "person_name":
                 mapping["assignee"] = header
                 break
 
     # ============ STATUS DETECTION ============
-    status_patterns = ["status", "state", "stage", "column", "progress", "phase"]
-    for pattern in status_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["status"] = h_orig
-                break
-        if mapping["status"]:
-            break
+    mapping["status"] = next(iter(candidates.get("status", ())), None)
 
     # Check column analysis for status
     if not mapping["status"]:
         for header, analysis in column_analysis.items():
-            if analysis.get("type") == "status":
+            if analysis.type == "status":
                 mapping["status"] = header
                 break
 
     # ============ DATE DETECTION ============
-    start_patterns = ["start", "begin", "created"]
-    end_patterns = ["due", "deadline", "end", "target", "finish", "complete by"]
+    mapping["due_date"] = next(iter(candidates.get("due_date", ())), None)
+    mapping["start_date"] = next(
+        (h for h in candidates.get("start_date", ()) if h != mapping["due_date"]), None
+    )
 
-    for pattern in end_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["due_date"] = h_orig
-                break
-        if mapping["due_date"]:
-            break
+    # ============ LABELS DETECTION ============
+    mapping["labels"] = next(iter(candidates.get("labels", ())), None)
 
-    for pattern in start_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower and h_orig != mapping["due_date"]:
-                mapping["start_date"] = h_orig
-                break
-        if mapping["start_date"]:
-            break
+    return mapping, *mapping_confidence(mapping)
 
-    # ============ LABELS DETECTION ============
-    label_patterns = ["label", "tag", "category", "type", "kind", "group", "epic", "theme"]
-    for pattern in label_patterns:
-        for h_lower, h_orig in headers_lower.items():
-            if pattern in h_lower:
-                mapping["labels"] = h_orig
-                break
-        if mapping["labels"]:
-            break
 
-    # ============ CONFIDENCE CALCULATION ============
+def known_export_mapping(headers):
+    """Return the field mapping of a recognized tool export, or None."""
+    by_lower = {}
+    for header in headers:
+        by_lower.setdefault(header.strip().lower(), header)
+
+    for required, fields in KNOWN_EXPORT_MAPPINGS.values():
+        if required <= by_lower.keys():
+            return {
+                field_name: by_lower[column]
+                for field_name, column in fields.items()
+                if column in by_lower
+            }
+    return None
+
+
+def mapping_confidence(mapping):
+    """Score a column mapping by the fields it found.
+
+    Returns (confidence, confidence_details).
+    """
     confidence = 0
     confidence_details = {}
 
@@ -678,20 +991,26 @@ def smart_detect_column_mapping(headers, rows, data_types, column_analysis=None)
         confidence += 2
         confidence_details["labels"] = "found"
 
-    return mapping, confidence, confidence_details
+    return confidence, confidence_details
 
 
 @imports_bp.route("/upload", methods=["POST"])
 @jwt_required()
 def upload_file():
     """Upload and parse an Excel or CSV file with intelligent detection."""
+    # Reject oversized bodies from the header alone, before the form is parsed.
+    # MAX_CONTENT_LENGTH also caps the body, but with a generic error.
+    content_length = request.content_length
+    if content_length and content_length > MAX_FILE_SIZE + MAX_FORM_OVERHEAD:
+        return jsonify({"error": "File too large. Maximum size is 10MB"}), 413
+
     user_id = get_jwt_identity()
     project_id = request.form.get("project_id")
 
     if not project_id:
         return jsonify({"error": "project_id required"}), 400
 
-    project, membership = check_project_access(project_id, user_id)
+    project, membership = get_project_access(project_id, user_id)
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
 
@@ -699,73 +1018,93 @@ def upload_file():
         return jsonify({"error": "No file uploaded"}), 400
 
     file = request.files["file"]
+    filename = file.filename
 
-    if file.filename == "":
+    if filename == "":
         return jsonify({"error": "No file selected"}), 400
 
-    if not allowed_file(file.filename):
+    ext = file_extension(filename)
+    if ext not in ALLOWED_EXTENSIONS:
         return jsonify({"error": "File type not allowed. Supported: xlsx, xls, csv"}), 400
 
-    # Check file size
-    file.seek(0, 2)
-    file_size = file.tell()
-    file.seek(0)
-
-    if file_size > MAX_FILE_SIZE:
-        return jsonify({"error": "File too large. Maximum size is 10MB"}), 400
-
     # Generate unique import ID and save file
     import_id = str(uuid_lib.uuid4())
-    ext = file.filename.rsplit(".", 1)[1].lower()
     secure_name = f"{import_id}.{ext}"
 
     # Create uploads directory if needed
     upload_dir = os.path.join(UPLOAD_FOLDER, "imports")
     os.makedirs(upload_dir, exist_ok=True)
+    expire_import_files(upload_dir)
 
     file_path = os.path.join(upload_dir, secure_name)
     file.save(file_path)
 
+    # The body limit leaves room for form overhead, so check the saved size
+    file_size = os.path.getsize(file_path)
+    if file_size > MAX_FILE_SIZE:
+        os.remove(file_path)
+        return jsonify({"error": "File too large. Maximum size is 10MB"}), 413
+
+    # Parsing and detection run in the background; clients poll /status
+    import_sessions.create({
+        "id": import_id,
+        "project_id": project_id,
+        "user_id": user_id,
+        "file_path": file_path,
+        "file_type": ext,
+        "original_filename": filename,
+        "file_size": file_size,
+        "status": "processing",
+        "created_at": datetime.now().isoformat(),
+    })
+    tasks.submit(analyze_import, import_id)
+
+    return jsonify({
+        "import_id": import_id,
+        "filename": filename,
+        "file_type": ext,
+        "status": "processing",
+    }), 202
+
+
+def analyze_import(import_id):
+    """Parse an uploaded file and run intelligent detection on it.
+
+    Runs as a background task. Fills in the import session and marks it
+    "preview", or "failed" with an error message (removing the file).
+    """
+    session = import_sessions.get(import_id)
+    if not session:
+        return
+    file_path = session["file_path"]
+
     try:
-        # Parse raw data first (all rows)
-        if ext in ["xlsx", "xls"]:
-            raw_rows = parse_excel_raw(file_path)
-        else:
-            raw_rows = parse_csv_raw(file_path)
+        # Parse the first rows up front; the rest is streamed below
+        raw_head, raw_rest = parse_raw(file_path, session["file_type"])
 
-        if not raw_rows or len(raw_rows) == 0:
-            os.remove(file_path)
-            return jsonify({"error": "File appears to be empty"}), 400
+        if not raw_head:
+            return fail_import(session, "File appears to be empty")
 
         # Intelligent header row detection
-        header_row_idx, detected_header = detect_header_row(raw_rows)
+        header_row_idx, detected_header = detect_header_row(raw_head)
 
         # Process into structured data
-        headers, rows = process_raw_to_structured(raw_rows, header_row_idx)
+        headers, rows = process_raw_to_structured(chain(raw_head, raw_rest), header_row_idx)
 
         if not headers or len(headers) == 0:
-            os.remove(file_path)
-            return jsonify({"error": "Could not detect headers in file"}), 400
+            return fail_import(session, "Could not detect headers in file")
+
+        # Normalize the analysis sample once for all of the detectors below
+        sample = normalize_sample(headers, rows)
 
-        # Deep column analysis
-        column_analysis = analyze_column_patterns(headers, rows)
+        # Deep column analysis and data types in one pass over the sample
+        column_analysis, data_types, adjacent_stats = analyze_columns(headers, sample)
 
         # Detect hierarchical structure
-        hierarchy_info = detect_hierarchical_structure(rows, headers)
+        hierarchy_info = detect_hierarchical_structure(sample, headers)
 
         # Detect adjacent content columns (ID + Description pairs)
-        adjacent_pairs = detect_adjacent_content_columns(headers, rows, {})
-
-        # Detect data types
-        data_types = {}
-        for header in headers:
-            sample_values = [row.get(header) for row in rows[:15] if row.get(header)]
-            types = [detect_data_type(v) for v in sample_values]
-            non_empty_types = [t for t in types if t != "empty"]
-            if non_empty_types:
-                data_types[header] = max(set(non_empty_types), key=non_empty_types.count)
-            else:
-                data_types[header] = "text"
+        adjacent_pairs = detect_adjacent_content_columns(headers, sample, data_types, adjacent_stats)
 
         structure = {
             "headers": headers,
@@ -781,22 +1120,13 @@ def upload_file():
 
         # Smart detect column mapping with all intelligence
         smart_mapping, confidence, confidence_details = smart_detect_column_mapping(
-            headers, rows, data_types, column_analysis
+            headers, sample, data_types, column_analysis
         )
 
         # Store session data
-        import_sessions[import_id] = {
-            "id": import_id,
-            "project_id": project_id,
-            "user_id": user_id,
-            "file_path": file_path,
-            "file_type": ext,
-            "original_filename": file.filename,
-            "file_size": file_size,
-            "raw_rows": raw_rows,
+        session.update({
             "header_row_idx": header_row_idx,
             "headers": headers,
-            "rows": rows,
             "structure": structure,
             "smart_mapping": smart_mapping,
             "mapping_confidence": confidence,
@@ -804,36 +1134,74 @@ def upload_file():
             "column_analysis": column_analysis,
             "hierarchy_info": hierarchy_info,
             "adjacent_pairs": adjacent_pairs,
-            "status": "preview",
-            "created_at": datetime.now().isoformat(),
-        }
-
-        # Return preview data with all intelligent detection info
-        return jsonify({
-            "import_id": import_id,
-            "filename": file.filename,
-            "file_type": ext,
-            "structure": structure,
-            "preview_rows": rows[:15],  # First 15 rows for preview
-            "smart_mapping": smart_mapping,
-            "mapping_confidence": confidence,
-            "confidence_details": confidence_details,
-            "insights": {
-                "header_row": header_row_idx + 1,
-                "is_hierarchical": hierarchy_info["is_hierarchical"],
-                "hierarchy_pattern": hierarchy_info.get("hierarchy_pattern"),
-                "adjacent_content_detected": len(adjacent_pairs) > 0,
-                "adjacent_pairs": adjacent_pairs,
-            }
-        }), 201
+        })
+        session["status"] = "preview"
+        import_sessions.save(session, rows)
 
     except Exception as e:
-        # Cleanup on error
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        import traceback
-        traceback.print_exc()
-        return jsonify({"error": f"Failed to parse file: {str(e)}"}), 400
+        logger.exception(f"Failed to parse import file {file_path}")
+        fail_import(session, f"Failed to parse file: {str(e)}")
+
+
+def fail_import(session, error):
+    """Mark an import session as failed and remove its file."""
+    session["error"] = error
+    session["status"] = "failed"
+    if os.path.exists(session["file_path"]):
+        os.remove(session["file_path"])
+    import_sessions.save(session)
+
+
+def import_not_ready(session):
+    """Return an error response if the session is still being analyzed or failed."""
+    if session["status"] == "processing":
+        return jsonify({"error": "Import is still being analyzed"}), 409
+    if session["status"] == "failed":
+        return jsonify({"error": session["error"]}), 400
+    return None
+
+
+@imports_bp.route("/<import_id>/status", methods=["GET"])
+@jwt_required()
+def get_import_status(import_id):
+    """Get the analysis status of an upload, with its preview once ready."""
+    user_id = get_jwt_identity()
+
+    session = import_sessions.get(import_id)
+    if not session:
+        return jsonify({"error": "Import session not found"}), 404
+
+    if session["user_id"] != user_id:
+        return jsonify({"error": "Forbidden"}), 403
+
+    if session["status"] == "processing":
+        return jsonify({"import_id": import_id, "status": "processing"})
+
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
+    # Preview data with all intelligent detection info
+    hierarchy_info = session["hierarchy_info"]
+    adjacent_pairs = session["adjacent_pairs"]
+    return jsonify({
+        "import_id": import_id,
+        "status": session["status"],
+        "filename": session["original_filename"],
+        "file_type": session["file_type"],
+        "structure": session["structure"],
+        "preview_rows": session["preview_rows"][:15],  # First 15 rows for preview
+        "smart_mapping": session["smart_mapping"],
+        "mapping_confidence": session["mapping_confidence"],
+        "confidence_details": session["confidence_details"],
+        "insights": {
+            "header_row": session["header_row_idx"] + 1,
+            "is_hierarchical": hierarchy_info["is_hierarchical"],
+            "hierarchy_pattern": hierarchy_info.get("hierarchy_pattern"),
+            "adjacent_content_detected": len(adjacent_pairs) > 0,
+            "adjacent_pairs": adjacent_pairs,
+        }
+    })
 
 
 @imports_bp.route("/<import_id>/preview", methods=["GET"])
@@ -849,19 +1217,83 @@ def get_preview(import_id):
     if session["user_id"] != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
     return jsonify({
         "import_id": import_id,
         "filename": session["original_filename"],
         "file_type": session["file_type"],
         "structure": session["structure"],
-        "preview_rows": session["rows"][:20],
+        "preview_rows": session["preview_rows"],
     })
 
 
+def parse_story_points(value):
+    """Parse points from "16 pts", "2h", "3 hours", "5", etc., or None."""
+    match = POINTS_RE.match(str(value).lower().strip())
+    if match:
+        try:
+            return int(float(match.group(1)))
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+def split_labels(value):
+    """Split a comma-separated labels cell into a list."""
+    return [label for label in map(str.strip, str(value).split(",")) if label]
+
+
+# Converters from a non-empty mapped cell to the task field's value
+IMPORT_FIELD_CONVERTERS = {
+    "description": lambda value: str(value).strip()[:5000],
+    "priority": lambda value: PRIORITY_LEVELS.get(str(value).upper().strip()),
+    "story_points": parse_story_points,
+    "status": lambda value: str(value).strip(),
+    "assignee": lambda value: str(value).strip(),
+    "due_date": lambda value: str(value).strip(),
+    "start_date": lambda value: str(value).strip(),
+    "labels": split_labels,
+}
+
+
+@dataclass(slots=True)
+class ImportTask:
+    """A task extracted from an import row.
+
+    Serialized as a plain object in responses and in the stored session.
+    """
+
+    title: str
+    description: str = ""
+    priority: Optional[str] = None
+    story_points: Optional[int] = None
+    status: Optional[str] = None
+    assignee: Optional[str] = None
+    due_date: Optional[str] = None
+    start_date: Optional[str] = None
+    labels: list = field(default_factory=list)
+    parent_id: Optional[str] = None
+    hierarchy_level: int = 0
+    original_row: int = 0
+
+
 @imports_bp.route("/<import_id>/process", methods=["POST"])
 @jwt_required()
 def process_import(import_id):
-    """Process import with intelligent task extraction and AI enhancement."""
+    """Process import with intelligent task extraction and AI enhancement.
+
+    An optional "limit" extracts tasks from only the first that many rows, so
+    it can yield fewer tasks when some rows are skipped. Limited runs are
+    previews: task_count and processing_insights cover only the tasks
+    extracted, the session's extracted tasks are left untouched and no AI
+    enhancement is run.
+
+    AI suggestions and analysis are generated in the background and fetched
+    from the ai-analysis-status endpoint once "ai_status" is "ready".
+    """
     user_id = get_jwt_identity()
 
     session = import_sessions.get(import_id)
@@ -871,24 +1303,49 @@ def process_import(import_id):
     if session["user_id"] != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
     # Get column mapping from request or use smart detection
     data = request.json or {}
     column_mapping = data.get("column_mapping") or session.get("smart_mapping", {})
     use_ai = data.get("use_ai", True)
     use_smart_titles = data.get("use_smart_titles", True)
+    limit = data.get("limit")
+
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+        return jsonify({"error": "limit must be a positive integer"}), 400
 
     # Get adjacent pairs for smart title generation
     adjacent_pairs = session.get("adjacent_pairs", [])
     hierarchy_info = session.get("hierarchy_info", {})
 
+    # Convert each mapped field one column at a time; None keeps the task default
+    rows = import_sessions.get_rows(import_id)
+    if limit:
+        rows = rows[:limit]
+    converted_columns = []
+    for field_name, convert in IMPORT_FIELD_CONVERTERS.items():
+        column = column_mapping.get(field_name)
+        if column:
+            converted_columns.append((
+                field_name,
+                [convert(value) if value else None for value in (row.get(column) for row in rows)],
+            ))
+
+    # Per-row lookups that don't depend on the row
+    title_col = column_mapping.get("title")
+    content_columns = [pair.get("content_column") for pair in adjacent_pairs]
+    id_col = hierarchy_info.get("id_column") if hierarchy_info.get("is_hierarchical") else None
+
     # Extract tasks from rows with intelligent processing
-    tasks = []
+    extracted_tasks = []
     parent_task_map = {}  # For hierarchical task reconstruction
 
-    for row_idx, row in enumerate(session["rows"]):
+    for row_idx, row in enumerate(rows):
         # Smart title extraction
         title = None
-        title_col = column_mapping.get("title")
 
         if use_smart_titles:
             title = smart_generate_title(row, column_mapping, adjacent_pairs)
@@ -896,238 +1353,144 @@ def process_import(import_id):
             title = row.get(title_col) if title_col else None
 
         # Skip rows without meaningful content
-        if not title or str(title).strip() == "":
+        title_str = str(title).strip() if title else ""
+        if not title_str:
             # Try to get title from adjacent content column
-            for pair in adjacent_pairs:
-                content = row.get(pair.get("content_column"))
-                if content and str(content).strip():
-                    title = str(content).strip()
+            for content_column in content_columns:
+                content = row.get(content_column)
+                content_str = str(content).strip() if content else ""
+                if content_str:
+                    title_str = content_str
                     break
 
-        if not title or str(title).strip() == "":
+        if not title_str:
             continue
 
-        title_str = str(title).strip()
-
         # Skip if title is just a number and we have no other content
         if title_str.isdigit() and len(title_str) <= 3:
-            # Check if we have actual content elsewhere
-            has_content = False
-            for header in session["headers"]:
-                val = row.get(header)
-                if val and str(val).strip() and not str(val).strip().isdigit():
-                    has_content = True
-                    break
+            # Check if we have actual content elsewhere (rows only hold header keys)
+            has_content = any(
+                val and (val_str := str(val).strip()) and not val_str.isdigit()
+                for val in row.values()
+            )
             if not has_content:
                 continue
 
-        task = {
-            "title": title_str[:500],
-            "description": "",
-            "priority": None,
-            "story_points": None,
-            "status": None,
-            "assignee": None,
-            "due_date": None,
-            "start_date": None,
-            "labels": [],
-            "parent_id": None,
-            "hierarchy_level": 0,
-            "original_row": row_idx + 1,
-        }
+        task = ImportTask(title_str[:500], original_row=row_idx + 1)
 
-        # Map description
-        if column_mapping.get("description"):
-            desc = row.get(column_mapping["description"])
-            if desc:
-                task["description"] = str(desc).strip()[:5000]
-
-        # Map priority with smart conversion
-        if column_mapping.get("priority"):
-            prio = row.get(column_mapping["priority"])
-            if prio:
-                prio_str = str(prio).upper().strip()
-                if prio_str in ["P0", "P1", "P2", "P3", "P4"]:
-                    task["priority"] = prio_str
-                elif prio_str in ["CRITICAL", "URGENT", "HIGHEST"]:
-                    task["priority"] = "P0"
-                elif prio_str == "HIGH":
-                    task["priority"] = "P1"
-                elif prio_str in ["MEDIUM", "NORMAL", "MED"]:
-                    task["priority"] = "P2"
-                elif prio_str == "LOW":
-                    task["priority"] = "P3"
-                elif prio_str in ["LOWEST", "MINOR"]:
-                    task["priority"] = "P4"
-
-        # Map story points / estimate with smart parsing
-        if column_mapping.get("story_points"):
-            points = row.get(column_mapping["story_points"])
-            if points:
-                points_str = str(points).lower().strip()
-                # Parse various formats: "16 pts", "2h", "3 hours", "5", etc.
-                match = re.match(r"^(\d+\.?\d*)\s*(pts?|points?|h|hr|hrs|hours?)?", points_str)
-                if match:
-                    try:
-                        task["story_points"] = int(float(match.group(1)))
-                    except (ValueError, TypeError):
-                        pass
-
-        # Map status
-        if column_mapping.get("status"):
-            status = row.get(column_mapping["status"])
-            if status:
-                task["status"] = str(status).strip()
-
-        # Map assignee
-        if column_mapping.get("assignee"):
-            assignee = row.get(column_mapping["assignee"])
-            if assignee:
-                task["assignee"] = str(assignee).strip()
-
-        # Map dates
-        if column_mapping.get("due_date"):
-            due = row.get(column_mapping["due_date"])
-            if due:
-                task["due_date"] = str(due).strip()
-
-        if column_mapping.get("start_date"):
-            start = row.get(column_mapping["start_date"])
-            if start:
-                task["start_date"] = str(start).strip()
-
-        # Map labels (handle comma-separated)
-        if column_mapping.get("labels"):
-            labels = row.get(column_mapping["labels"])
-            if labels:
-                labels_str = str(labels).strip()
-                if "," in labels_str:
-                    task["labels"] = [l.strip() for l in labels_str.split(",") if l.strip()]
-                else:
-                    task["labels"] = [labels_str] if labels_str else []
+        # Copy the mapped fields converted column by column above
+        for field_name, values in converted_columns:
+            value = values[row_idx]
+            if value is not None:
+                setattr(task, field_name, value)
 
         # Handle hierarchical structure
-        if hierarchy_info.get("is_hierarchical"):
-            id_col = hierarchy_info.get("id_column")
-            if id_col:
-                task_id = row.get(id_col)
-                if task_id:
-                    task_id_str = str(task_id).strip()
-                    # Check for hierarchical numbering (1.1, 1.2, 2.1, etc.)
-                    if "." in task_id_str:
-                        parts = task_id_str.split(".")
-                        task["hierarchy_level"] = len(parts) - 1
-                        if len(parts) > 1:
-                            parent_id = ".".join(parts[:-1])
-                            task["parent_id"] = parent_id
-                    parent_task_map[task_id_str] = len(tasks)
-
-        tasks.append(task)
-
-    # AI enhancement if enabled
-    ai_suggestions = None
-    ai_analysis = None
-    if use_ai and tasks:
-        ai_service = get_ai_service()
-        if ai_service.is_enabled():
-            # Send task summary for AI analysis
-            ai_suggestions = ai_service.enhance_imported_tasks(tasks[:25])
-
-            # Also try to get AI analysis of the overall structure
-            ai_analysis = ai_analyze_import_structure(tasks, session.get("structure", {}))
-
-    # Update session
-    session["extracted_tasks"] = tasks
-    session["column_mapping"] = column_mapping
-    session["ai_suggestions"] = ai_suggestions
-    session["ai_analysis"] = ai_analysis
-    session["status"] = "processed"
+        if id_col:
+            task_id = row.get(id_col)
+            if task_id:
+                task_id_str = str(task_id).strip()
+                # Check for hierarchical numbering (1.1, 1.2, 2.1, etc.)
+                if "." in task_id_str:
+                    task.hierarchy_level = task_id_str.count(".")
+                    task.parent_id = task_id_str.rsplit(".", 1)[0]
+                parent_task_map[task_id_str] = len(extracted_tasks)
+
+        extracted_tasks.append(task)
+
+    # Update session (limited previews don't replace the extracted tasks)
+    ai_status = None
+    if not limit:
+        session["extracted_tasks"] = extracted_tasks
+        session["column_mapping"] = column_mapping
+        session["ai_suggestions"] = None
+        session["ai_analysis"] = None
+        session["status"] = "processed"
+        session["ai_job_id"] = uuid_lib.uuid4().hex
+        if use_ai and extracted_tasks and get_ai_service().is_enabled():
+            ai_status = "pending"
+        session["ai_status"] = ai_status
+        import_sessions.save(session)
+
+        # AI enhancement runs in the background; clients poll ai-analysis-status
+        if ai_status:
+            queue_import_ai(session)
+
+    # Count filled-in fields in one pass over the tasks
+    with_description = with_priority = with_points = with_assignee = hierarchical = 0
+    for task in extracted_tasks:
+        with_description += bool(task.description)
+        with_priority += bool(task.priority)
+        with_points += bool(task.story_points)
+        with_assignee += bool(task.assignee)
+        hierarchical += task.hierarchy_level > 0
 
     return jsonify({
         "import_id": import_id,
-        "task_count": len(tasks),
-        "tasks": tasks[:75],  # Return first 75 for preview
-        "ai_suggestions": ai_suggestions,
-        "ai_analysis": ai_analysis,
+        "task_count": len(extracted_tasks),
+        "tasks": extracted_tasks[:75],  # Return first 75 for preview
+        "ai_status": ai_status,
         "column_mapping": column_mapping,
         "hierarchy_detected": hierarchy_info.get("is_hierarchical", False),
         "processing_insights": {
-            "tasks_extracted": len(tasks),
-            "tasks_with_description": sum(1 for t in tasks if t.get("description")),
-            "tasks_with_priority": sum(1 for t in tasks if t.get("priority")),
-            "tasks_with_points": sum(1 for t in tasks if t.get("story_points")),
-            "tasks_with_assignee": sum(1 for t in tasks if t.get("assignee")),
-            "hierarchical_tasks": sum(1 for t in tasks if t.get("hierarchy_level", 0) > 0),
+            "tasks_extracted": len(extracted_tasks),
+            "tasks_with_description": with_description,
+            "tasks_with_priority": with_priority,
+            "tasks_with_points": with_points,
+            "tasks_with_assignee": with_assignee,
+            "hierarchical_tasks": hierarchical,
         }
     })
 
 
-def ai_analyze_import_structure(tasks, structure):
-    """Use AI to analyze the import structure and provide insights."""
-    ai_service = get_ai_service()
-    if not ai_service.is_enabled():
-        return None
+def queue_import_ai(session):
+    """Start AI enhancement of the session's extracted tasks in the background."""
+    tasks.submit(run_import_ai, session["id"], session["ai_job_id"])
 
-    try:
-        # Prepare summary for AI
-        task_summary = []
-        for t in tasks[:20]:
-            task_summary.append({
-                "title": t.get("title", "")[:100],
-                "has_description": bool(t.get("description")),
-                "priority": t.get("priority"),
-                "points": t.get("story_points"),
-                "status": t.get("status"),
-            })
 
-        prompt = f"""Analyze this imported task list and provide insights:
-
-IMPORT STATISTICS:
-- Total tasks: {len(tasks)}
-- Column count: {structure.get('column_count', 'unknown')}
-- Header row: {structure.get('header_row_detected', 'row 1')}
-
-SAMPLE TASKS:
-{json.dumps(task_summary, indent=2)}
-
-Provide analysis in JSON format:
-{{
-    "data_quality_score": <1-10>,
-    "completeness": {{
-        "has_good_titles": true/false,
-        "has_descriptions": true/false,
-        "has_estimates": true/false,
-        "has_priorities": true/false
-    }},
-    "recommendations": [
-        "recommendation 1",
-        "recommendation 2"
-    ],
-    "detected_project_type": "software|marketing|design|operations|general",
-    "suggested_workflow": "kanban|scrum|simple"
-}}"""
-
-        from openai import OpenAI
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a project management expert analyzing imported task data. Provide concise, actionable insights."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=500,
+def run_import_ai(import_id, job_id):
+    """Generate AI suggestions and analysis for a session's extracted tasks.
+
+    Runs as a background task. Results are dropped if the session is gone
+    or has been re-processed since the job was queued (its ai_job_id moved on).
+    """
+    session = import_sessions.get(import_id)
+    if not session or session.get("ai_job_id") != job_id:
+        return
+
+    # Tasks come back from the store as plain dicts
+    result = None
+    try:
+        result = get_ai_service().enhance_imported_tasks(
+            session["extracted_tasks"], session.get("structure", {})
         )
+    finally:
+        session = import_sessions.get(import_id)
+        if session and session.get("ai_job_id") == job_id:
+            session["ai_suggestions"] = result["suggestions"] if result else None
+            session["ai_analysis"] = result["analysis"] if result else None
+            session["ai_status"] = "ready"
+            import_sessions.save(session)
 
-        return json.loads(response.choices[0].message.content)
-    except Exception as e:
-        import logging
-        logging.error(f"AI import analysis failed: {e}")
-        return None
+
+@imports_bp.route("/<import_id>/ai-analysis-status", methods=["GET"])
+@jwt_required()
+def get_ai_analysis_status(import_id):
+    """Get the status of an import's AI enhancement, with its results once ready."""
+    user_id = get_jwt_identity()
+
+    session = import_sessions.get(import_id)
+    if not session:
+        return jsonify({"error": "Import session not found"}), 404
+
+    if session["user_id"] != user_id:
+        return jsonify({"error": "Forbidden"}), 403
+
+    return jsonify({
+        "import_id": import_id,
+        "ai_status": session.get("ai_status"),
+        "ai_suggestions": session.get("ai_suggestions"),
+        "ai_analysis": session.get("ai_analysis"),
+    })
 
 
 @imports_bp.route("/<import_id>/confirm", methods=["POST"])
@@ -1143,6 +1506,10 @@ def confirm_import(import_id):
     if session["user_id"] != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
     data = request.json or {}
     approved_tasks = data.get("tasks", session.get("extracted_tasks", []))
     board_id = data.get("board_id")
@@ -1163,37 +1530,48 @@ def confirm_import(import_id):
             return jsonify({"error": "No column found in board. Create a column first."}), 400
         column_id = column.id
 
-    # Create cards
-    created_cards = []
-    max_position = db.session.query(db.func.max(Card.position)).filter_by(column_id=column_id).scalar() or 0
-
-    for i, task in enumerate(approved_tasks):
-        if not task.get("title"):
-            continue
-
-        card = Card(
-            column_id=column_id,
-            title=task["title"][:500],  # Limit title length
-            description=task.get("description", "")[:5000] if task.get("description") else None,
-            priority=task.get("priority"),
-            story_points=task.get("story_points"),
-            position=max_position + i + 1,
-            created_by=user_id,
-        )
-        db.session.add(card)
-        created_cards.append(card)
+    # Create cards with one bulk INSERT ... RETURNING id. Positions continue
+    # after the column's last card, read by a subquery inside the INSERT
+    # itself. Each batch the INSERT is split into sees the cards of earlier
+    # batches, so positions always increase in task order (possibly with gaps).
+    last_position = (
+        select(func.coalesce(func.max(Card.position), 0))
+        .where(Card.column_id == column_id)
+        .scalar_subquery()
+    )
 
+    card_rows = [
+        {
+            "column_id": column_id,
+            "title": task["title"][:500],  # Limit title length
+            "description": task["description"][:5000] if task.get("description") else None,
+            "priority": task.get("priority"),
+            "story_points": task.get("story_points"),
+            "position_offset": i + 1,
+            "created_by": user_id,
+        }
+        for i, task in enumerate(approved_tasks)
+        if task.get("title")
+    ]
+    card_ids = []
+    if card_rows:
+        card_ids = db.session.scalars(
+            insert(Card)
+            .values(position=last_position + bindparam("position_offset"))
+            .returning(Card.id, sort_by_parameter_order=True),
+            card_rows,
+        ).all()
     db.session.commit()
 
     # Cleanup session
     if os.path.exists(session["file_path"]):
         os.remove(session["file_path"])
-    del import_sessions[import_id]
+    import_sessions.delete(import_id)
 
     return jsonify({
-        "message": f"Successfully created {len(created_cards)} cards",
-        "created_count": len(created_cards),
-        "card_ids": [str(c.id) for c in created_cards],
+        "message": f"Successfully created {len(card_ids)} cards",
+        "created_count": len(card_ids),
+        "card_ids": [str(card_id) for card_id in card_ids],
         "board_id": str(board_id),
         "column_id": str(column_id),
     })
@@ -1215,7 +1593,7 @@ def cancel_import(import_id):
     # Cleanup
     if os.path.exists(session["file_path"]):
         os.remove(session["file_path"])
-    del import_sessions[import_id]
+    import_sessions.delete(import_id)
 
     return jsonify({"message": "Import cancelled"})
 
@@ -1233,6 +1611,10 @@ def ai_analyze_structure(import_id):
     if session["user_id"] != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
     ai_service = get_ai_service()
     if not ai_service.is_enabled():
         return jsonify({
@@ -1242,14 +1624,13 @@ def ai_analyze_structure(import_id):
 
     # Get AI analysis
     headers = session.get("headers", [])
-    rows = session.get("rows", [])
+    rows = session.get("preview_rows", [])
 
     # Build raw preview from first few raw rows
-    raw_preview = ""
-    raw_rows = session.get("raw_rows", [])
-    if raw_rows:
-        for i, row in enumerate(raw_rows[:8]):
-            raw_preview += f"Row {i+1}: {' | '.join(str(c)[:30] for c in row if c)}\n"
+    raw_preview = "".join(
+        f"Row {i+1}: {' | '.join(str(c)[:30] for c in row if c)}\n"
+        for i, row in enumerate(read_raw_head(session, 8))
+    )
 
     ai_result = ai_service.analyze_spreadsheet_structure(headers, rows[:10], raw_preview)
 
@@ -1265,6 +1646,7 @@ def ai_analyze_structure(import_id):
                 merged_mapping[key] = value
 
         session["ai_enhanced_mapping"] = merged_mapping
+        import_sessions.save(session)
 
         return jsonify({
             "import_id": import_id,
@@ -1293,52 +1675,45 @@ def redetect_headers(import_id):
     if session["user_id"] != user_id:
         return jsonify({"error": "Forbidden"}), 403
 
+    not_ready = import_not_ready(session)
+    if not_ready:
+        return not_ready
+
     data = request.json or {}
     new_header_row = data.get("header_row")  # 1-indexed
 
     if new_header_row is None:
         return jsonify({"error": "header_row is required (1-indexed)"}), 400
 
-    raw_rows = session.get("raw_rows", [])
-    if not raw_rows:
+    if not os.path.exists(session["file_path"]):
         return jsonify({"error": "Raw data not available"}), 400
 
     header_row_idx = int(new_header_row) - 1  # Convert to 0-indexed
 
-    if header_row_idx < 0 or header_row_idx >= len(raw_rows):
-        return jsonify({"error": f"Invalid header row. Must be between 1 and {len(raw_rows)}"}), 400
+    if header_row_idx < 0:
+        return jsonify({"error": "Invalid header row. Must be 1 or greater"}), 400
 
-    # Reprocess with new header row
-    headers, rows = process_raw_to_structured(raw_rows, header_row_idx)
+    # Re-read the saved file and reprocess with the new header row
+    raw_head, raw_rest = parse_raw(session["file_path"], session["file_type"])
+    headers, rows = process_raw_to_structured(chain(raw_head, raw_rest), header_row_idx)
 
     if not headers:
         return jsonify({"error": "Could not extract headers from specified row"}), 400
 
     # Re-run analysis
-    column_analysis = analyze_column_patterns(headers, rows)
-    hierarchy_info = detect_hierarchical_structure(rows, headers)
-    adjacent_pairs = detect_adjacent_content_columns(headers, rows, {})
-
-    # Detect data types
-    data_types = {}
-    for header in headers:
-        sample_values = [row.get(header) for row in rows[:15] if row.get(header)]
-        types = [detect_data_type(v) for v in sample_values]
-        non_empty_types = [t for t in types if t != "empty"]
-        if non_empty_types:
-            data_types[header] = max(set(non_empty_types), key=non_empty_types.count)
-        else:
-            data_types[header] = "text"
+    sample = normalize_sample(headers, rows)
+    column_analysis, data_types, adjacent_stats = analyze_columns(headers, sample)
+    hierarchy_info = detect_hierarchical_structure(sample, headers)
+    adjacent_pairs = detect_adjacent_content_columns(headers, sample, data_types, adjacent_stats)
 
     # Re-detect smart mapping
     smart_mapping, confidence, confidence_details = smart_detect_column_mapping(
-        headers, rows, data_types, column_analysis
+        headers, sample, data_types, column_analysis
     )
 
     # Update session
     session["header_row_idx"] = header_row_idx
     session["headers"] = headers
-    session["rows"] = rows
     session["smart_mapping"] = smart_mapping
     session["mapping_confidence"] = confidence
     session["confidence_details"] = confidence_details
@@ -1349,6 +1724,7 @@ def redetect_headers(import_id):
     session["structure"]["data_types"] = data_types
     session["structure"]["row_count"] = len(rows)
     session["structure"]["header_row_detected"] = new_header_row
+    import_sessions.save(session, rows)
 
     return jsonify({
         "import_id": import_id,
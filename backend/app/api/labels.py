@@ -1,7 +1,10 @@
 """Labels API endpoints."""
 
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select
 
 from ..extensions import db
 from ..models import Label, Board, Card, CardLabel
@@ -17,7 +20,7 @@ def list_labels():
     if not board_id:
         return jsonify({"error": "board_id is required"}), 400
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -38,7 +41,7 @@ def create_label():
     if not board_id:
         return jsonify({"error": "board_id is required"}), 400
 
-    board = Board.query.get(board_id)
+    board = db.session.get(Board, board_id)
     if not board:
         return jsonify({"error": "Board not found"}), 404
 
@@ -63,7 +66,7 @@ def create_label():
 @jwt_required()
 def update_label(label_id):
     """Update a label."""
-    label = Label.query.get(label_id)
+    label = db.session.get(Label, label_id)
     if not label:
         return jsonify({"error": "Label not found"}), 404
 
@@ -74,6 +77,11 @@ def update_label(label_id):
     if "color" in data:
         label.color = data["color"]
 
+    # Cards embed their labels, so the cards carrying this one have changed too
+    Card.query.filter(
+        Card.id.in_(select(CardLabel.card_id).where(CardLabel.label_id == label.id))
+    ).update({Card.updated_at: datetime.utcnow()}, synchronize_session=False)
+
     db.session.commit()
 
     return jsonify({"label": label.to_dict()})
@@ -83,7 +91,7 @@ def update_label(label_id):
 @jwt_required()
 def delete_label(label_id):
     """Delete a label."""
-    label = Label.query.get(label_id)
+    label = db.session.get(Label, label_id)
     if not label:
         return jsonify({"error": "Label not found"}), 404
 
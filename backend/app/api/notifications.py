@@ -1,8 +1,12 @@
 """Notifications API endpoints."""
 
+import base64
+import uuid
+from datetime import datetime
+
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import desc
+from sqlalchemy import desc, tuple_
 
 from ..extensions import db
 from ..models import Notification, NotificationType, User, Card, Project, Sprint
@@ -10,39 +14,69 @@ from ..models import Notification, NotificationType, User, Card, Project, Sprint
 notifications_bp = Blueprint("notifications", __name__)
 
 
+def encode_cursor(notification):
+    """Opaque cursor pointing just past notification in the feed order."""
+    raw = f"{notification.created_at.isoformat()}|{notification.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return the (created_at, id) pair of a cursor, or None if it is malformed."""
+    try:
+        created_at, notification_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(notification_id)
+    except ValueError:
+        return None
+
+
 @notifications_bp.route("", methods=["GET"])
 @jwt_required()
 def list_notifications():
-    """List notifications for the current user."""
+    """List notifications for the current user, newest first.
+
+    Pages are keyed on (created_at, id): pass the previous response's
+    next_cursor as ?cursor= to get the following page. unread_count is only
+    included on the first page.
+    """
     user_id = get_jwt_identity()
 
     # Query parameters
     unread_only = request.args.get("unread_only", "false").lower() == "true"
     limit = min(int(request.args.get("limit", 50)), 100)
-    offset = int(request.args.get("offset", 0))
+    cursor = request.args.get("cursor")
 
     query = Notification.query.filter_by(user_id=user_id)
 
     if unread_only:
         query = query.filter_by(is_read=False)
 
-    total = query.count()
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None:
+            return jsonify({"error": "Invalid cursor"}), 400
+        query = query.filter(tuple_(Notification.created_at, Notification.id) < position)
+
+    # One extra row tells us whether there is a next page
     notifications = (
         query
-        .order_by(desc(Notification.created_at))
-        .offset(offset)
-        .limit(limit)
+        .order_by(desc(Notification.created_at), desc(Notification.id))
+        .limit(limit + 1)
         .all()
     )
+    has_more = len(notifications) > limit
+    notifications = notifications[:limit]
 
-    # Count unread
-    unread_count = Notification.query.filter_by(user_id=user_id, is_read=False).count()
-
-    return jsonify({
+    result = {
         "notifications": [n.to_dict() for n in notifications],
-        "total": total,
-        "unread_count": unread_count,
-    })
+        "next_cursor": encode_cursor(notifications[-1]) if has_more else None,
+    }
+
+    # Only the first page counts unread notifications, so later pages stay
+    # O(limit); /unread-count serves the badge on its own
+    if not cursor:
+        result["unread_count"] = Notification.query.filter_by(user_id=user_id, is_read=False).count()
+
+    return jsonify(result)
 
 
 @notifications_bp.route("/unread-count", methods=["GET"])
@@ -159,7 +193,7 @@ def notify_card_assigned(card, assignee_id: str, actor_id: str):
     if assignee_id == actor_id:
         return  # Don't notify if self-assigning
 
-    actor = User.query.get(actor_id)
+    actor = db.session.get(User, actor_id)
     actor_name = actor.full_name or actor.email if actor else "Someone"
 
     # Get project_id through card -> column -> board -> project
@@ -185,7 +219,7 @@ def notify_card_commented(card, commenter_id: str, comment_text: str):
     """Notify card assignees and creator when a comment is added."""
     notified_users = set()
 
-    commenter = User.query.get(commenter_id)
+    commenter = db.session.get(User, commenter_id)
     commenter_name = commenter.full_name or commenter.email if commenter else "Someone"
 
     # Get action URL
@@ -231,7 +265,7 @@ def notify_card_commented(card, commenter_id: str, comment_text: str):
 
 def notify_card_moved(card, from_column_name: str, to_column_name: str, actor_id: str):
     """Notify card assignees when card is moved."""
-    actor = User.query.get(actor_id)
+    actor = db.session.get(User, actor_id)
     actor_name = actor.full_name or actor.email if actor else "Someone"
 
     action_url = None
@@ -257,7 +291,7 @@ def notify_card_moved(card, from_column_name: str, to_column_name: str, actor_id
 
 def notify_sprint_started(sprint, actor_id: str):
     """Notify project members when sprint starts."""
-    actor = User.query.get(actor_id)
+    actor = db.session.get(User, actor_id)
     actor_name = actor.full_name or actor.email if actor else "Someone"
 
     # Get all project members through cards in the sprint
@@ -284,7 +318,7 @@ def notify_sprint_started(sprint, actor_id: str):
 
 def notify_sprint_completed(sprint, actor_id: str):
     """Notify project members when sprint completes."""
-    actor = User.query.get(actor_id)
+    actor = db.session.get(User, actor_id)
     actor_name = actor.full_name or actor.email if actor else "Someone"
 
     notified_users = set()
@@ -88,7 +88,7 @@ def get_organization(org_id):
     if not membership:
         return jsonify({"error": "Organization not found"}), 404
 
-    org = Organization.query.get(org_id)
+    org = db.session.get(Organization, org_id)
     return jsonify({"organization": org.to_dict()})
 
 
@@ -111,7 +111,7 @@ def update_organization(org_id):
     except ValidationError as err:
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
-    org = Organization.query.get(org_id)
+    org = db.session.get(Organization, org_id)
     if not org:
         return jsonify({"error": "Organization not found"}), 404
 
@@ -138,7 +138,7 @@ def delete_organization(org_id):
     if not membership or membership.role != MemberRole.ADMIN:
         return jsonify({"error": "Forbidden"}), 403
 
-    org = Organization.query.get(org_id)
+    org = db.session.get(Organization, org_id)
     if not org:
         return jsonify({"error": "Organization not found"}), 404
 
@@ -5,7 +5,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import Schema, fields, validate, ValidationError
 
 from ..extensions import db
-from ..models import Project, Workspace, OrganizationMember
+from ..models import Project, Workspace
+from .access import get_membership
 
 projects_bp = Blueprint("projects", __name__)
 
@@ -21,13 +22,11 @@ project_schema = ProjectSchema()
 
 def check_workspace_access(workspace_id, user_id):
     """Check if user has access to workspace."""
-    workspace = Workspace.query.get(workspace_id)
+    workspace = db.session.get(Workspace, workspace_id)
     if not workspace:
         return None, None
 
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    membership = get_membership(workspace.organization_id, user_id)
 
     return workspace, membership
 
@@ -82,7 +81,7 @@ def get_project(project_id):
     """Get project by ID."""
     user_id = get_jwt_identity()
 
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return jsonify({"error": "Project not found"}), 404
 
@@ -99,7 +98,7 @@ def update_project(project_id):
     """Update project."""
     user_id = get_jwt_identity()
 
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return jsonify({"error": "Project not found"}), 404
 
@@ -123,7 +122,7 @@ def delete_project(project_id):
     """Delete project."""
     user_id = get_jwt_identity()
 
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return jsonify({"error": "Project not found"}), 404
 
@@ -8,8 +8,9 @@ from datetime import datetime
 from ..extensions import db
 from ..models import (
     Sprint, SprintStatus, CardSprint, Card, Project, Workspace,
-    OrganizationMember, SprintRetrospective, SprintNote, NoteType
+    SprintRetrospective, SprintNote, NoteType
 )
+from .access import get_membership
 
 sprints_bp = Blueprint("sprints", __name__)
 
@@ -36,14 +37,12 @@ sprint_update_schema = SprintUpdateSchema()
 
 def check_project_access(project_id, user_id):
     """Check if user has access to project."""
-    project = Project.query.get(project_id)
+    project = db.session.get(Project, project_id)
     if not project:
         return None, None
 
-    workspace = Workspace.query.get(project.workspace_id)
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    workspace = db.session.get(Workspace, project.workspace_id)
+    membership = get_membership(workspace.organization_id, user_id)
 
     return project, membership
 
@@ -114,7 +113,7 @@ def get_sprint(sprint_id):
     """Get sprint with cards."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -131,7 +130,7 @@ def update_sprint(sprint_id):
     """Update sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -165,7 +164,7 @@ def delete_sprint(sprint_id):
     """Delete sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -185,7 +184,7 @@ def start_sprint(sprint_id):
     """Start a sprint (set status to active)."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -215,7 +214,7 @@ def complete_sprint(sprint_id):
     """Complete a sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -240,7 +239,7 @@ def add_card_to_sprint(sprint_id):
     """Add a card to sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -252,7 +251,7 @@ def add_card_to_sprint(sprint_id):
     if not card_id:
         return jsonify({"error": "card_id required"}), 400
 
-    card = Card.query.get(card_id)
+    card = db.session.get(Card, card_id)
     if not card:
         return jsonify({"error": "Card not found"}), 404
 
@@ -276,7 +275,7 @@ def remove_card_from_sprint(sprint_id, card_id):
     """Remove a card from sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -304,7 +303,7 @@ def get_sprint_metrics(sprint_id):
     """Get sprint metrics (velocity, burndown data, etc.)."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -357,7 +356,7 @@ def get_retrospective(sprint_id):
     """Get sprint retrospective."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -377,7 +376,7 @@ def create_retrospective(sprint_id):
     """Create sprint retrospective."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -413,7 +412,7 @@ def update_retrospective(sprint_id):
     """Update sprint retrospective."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -449,7 +448,7 @@ def delete_retrospective(sprint_id):
     """Delete sprint retrospective."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -474,7 +473,7 @@ def generate_retrospective_summary(sprint_id):
 
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -531,7 +530,7 @@ def list_sprint_notes(sprint_id):
     """List all notes for a sprint."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -558,7 +557,7 @@ def create_sprint_note(sprint_id):
     """Create a sprint note."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -589,7 +588,7 @@ def update_sprint_note(sprint_id, note_id):
     """Update a sprint note."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
@@ -624,7 +623,7 @@ def delete_sprint_note(sprint_id, note_id):
     """Delete a sprint note."""
     user_id = get_jwt_identity()
 
-    sprint = Sprint.query.get(sprint_id)
+    sprint = db.session.get(Sprint, sprint_id)
     if not sprint:
         return jsonify({"error": "Sprint not found"}), 404
 
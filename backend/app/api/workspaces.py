@@ -5,7 +5,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import Schema, fields, validate, ValidationError
 
 from ..extensions import db
-from ..models import Workspace, OrganizationMember
+from ..models import Workspace
+from .access import get_membership
 
 workspaces_bp = Blueprint("workspaces", __name__)
 
@@ -29,9 +30,7 @@ def list_workspaces():
         return jsonify({"error": "organization_id required"}), 400
 
     # Check membership
-    membership = OrganizationMember.query.filter_by(
-        organization_id=org_id, user_id=user_id
-    ).first()
+    membership = get_membership(org_id, user_id)
 
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -52,9 +51,7 @@ def create_workspace():
         return jsonify({"error": "Validation failed", "details": err.messages}), 400
 
     # Check membership
-    membership = OrganizationMember.query.filter_by(
-        organization_id=data["organization_id"], user_id=user_id
-    ).first()
+    membership = get_membership(data["organization_id"], user_id)
 
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -75,14 +72,12 @@ def get_workspace(workspace_id):
     """Get workspace by ID."""
     user_id = get_jwt_identity()
 
-    workspace = Workspace.query.get(workspace_id)
+    workspace = db.session.get(Workspace, workspace_id)
     if not workspace:
         return jsonify({"error": "Workspace not found"}), 404
 
     # Check membership
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    membership = get_membership(workspace.organization_id, user_id)
 
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -96,14 +91,12 @@ def update_workspace(workspace_id):
     """Update workspace."""
     user_id = get_jwt_identity()
 
-    workspace = Workspace.query.get(workspace_id)
+    workspace = db.session.get(Workspace, workspace_id)
     if not workspace:
         return jsonify({"error": "Workspace not found"}), 404
 
     # Check membership
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    membership = get_membership(workspace.organization_id, user_id)
 
     if not membership:
         return jsonify({"error": "Forbidden"}), 403
@@ -122,15 +115,13 @@ def delete_workspace(workspace_id):
     """Delete workspace."""
     user_id = get_jwt_identity()
 
-    workspace = Workspace.query.get(workspace_id)
+    workspace = db.session.get(Workspace, workspace_id)
     if not workspace:
         return jsonify({"error": "Workspace not found"}), 404
 
     # Check admin membership
     from ..models import MemberRole
-    membership = OrganizationMember.query.filter_by(
-        organization_id=workspace.organization_id, user_id=user_id
-    ).first()
+    membership = get_membership(workspace.organization_id, user_id)
 
     if not membership or membership.role != MemberRole.ADMIN:
         return jsonify({"error": "Forbidden"}), 403
@@ -0,0 +1,27 @@
+"""orjson-backed JSON provider for Flask."""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """Encode jsonify() responses with orjson.
+
+    UUIDs, dates and datetimes are serialized natively; anything orjson does
+    not know (e.g. Decimal) falls back to Flask's default conversions.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=DefaultJSONProvider.default, option=ORJSON_OPTIONS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=DefaultJSONProvider.default, option=ORJSON_OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
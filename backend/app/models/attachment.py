@@ -21,6 +21,8 @@ class Attachment(db.Model, UUIDMixin, TimestampMixin):
     storage_path = SAColumn(String(500), nullable=False)  # Path in storage
     file_size = SAColumn(Integer, nullable=False)  # Size in bytes
     mime_type = SAColumn(String(100))  # MIME type
+    status = SAColumn(String(20), nullable=False, default="ready")  # uploading, ready, failed
+    checksum = SAColumn(String(64))  # SHA-256 hex digest, set once ready
     uploaded_by = SAColumn(UUID(as_uuid=True), ForeignKey("users.id"))
 
     # Relationships
@@ -35,6 +37,8 @@ class Attachment(db.Model, UUIDMixin, TimestampMixin):
             "filename": self.filename,
             "file_size": self.file_size,
             "mime_type": self.mime_type,
+            "status": self.status,
+            "checksum": self.checksum,
             "uploaded_by": str(self.uploaded_by) if self.uploaded_by else None,
             "uploaded_by_user": self.uploaded_by_user.to_dict() if self.uploaded_by_user else None,
             "created_at": self.created_at.isoformat(),
@@ -20,6 +20,14 @@ class UUIDMixin:
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
+    @property
+    def id_str(self):
+        """String form of the primary key, computed once per instance."""
+        cached = self.__dict__.get("_id_str")
+        if cached is None and self.id is not None:
+            cached = self.__dict__["_id_str"] = str(self.id)
+        return cached
+
 
 def generate_uuid():
     """Generate a new UUID."""
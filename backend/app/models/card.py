@@ -68,7 +68,7 @@ class Card(db.Model, UUIDMixin, TimestampMixin):
     def to_dict(self, include_details=False):
         """Serialize card to dictionary."""
         data = {
-            "id": str(self.id),
+            "id": self.id_str,
             "column_id": str(self.column_id),
             "title": self.title,
             "priority": self.priority.value if self.priority else None,
@@ -94,6 +94,19 @@ class Card(db.Model, UUIDMixin, TimestampMixin):
 
         return data
 
+    def to_list_dto(self):
+        """Serialize the slim card shape used by list endpoints."""
+        return {
+            "id": self.id_str,
+            "column_id": str(self.column_id),
+            "title": self.title,
+            "position": self.position,
+            "priority": self.priority.value if self.priority else None,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "assignee_count": len(self.assignees),
+            "label_ids": [str(l.label_id) for l in self.labels],
+        }
+
     def __repr__(self):
         return f"<Card {self.title[:30]}>"
 
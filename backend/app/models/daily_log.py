@@ -1,6 +1,11 @@
 """Daily log model."""
 
-from sqlalchemy import Column, Text, Date, ForeignKey, UniqueConstraint
+from datetime import date
+
+from sqlalchemy import (
+    Column, Integer, Text, Date, ForeignKey, UniqueConstraint, Index, Computed, DDL,
+    and_, event, func
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -8,38 +13,75 @@ from ..extensions import db
 from .base import UUIDMixin, TimestampMixin
 
 
+LOG_BUCKET_EPOCH = date(1970, 1, 1)
+
+
+def log_bucket_for(day):
+    """Return the log_bucket value the database computes for a date.
+
+    SQL integer division truncates toward zero, so dates before the epoch
+    are not floored the way Python's // would.
+    """
+    days = (day - LOG_BUCKET_EPOCH).days
+    return days // 7 if days >= 0 else -(-days // 7)
+
+
+# Generated columns cannot contain subqueries, so the sum lives in an
+# immutable SQL function that must exist before the table is created.
+TOTAL_TIME_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION daily_log_total_time(tasks jsonb) RETURNS integer
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT COALESCE(SUM((task->>'time_spent')::int), 0)::int
+    FROM jsonb_array_elements(COALESCE(tasks, '[]'::jsonb)) AS task
+$$
+""")
+
+
 class DailyLog(db.Model, UUIDMixin, TimestampMixin):
     """Daily log - programmer's daily time tracking."""
 
     __tablename__ = "daily_logs"
     __table_args__ = (
+        # Also the index behind the per-user list/today/summary queries: equality
+        # on (user_id, project_id) plus a log_date range or a backward scan for
+        # ORDER BY log_date DESC LIMIT n.
         UniqueConstraint("user_id", "project_id", "log_date", name="uq_daily_log"),
+        Index("ix_daily_logs_project_id_log_bucket", "project_id", "log_bucket"),
     )
 
-    user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
-    )
-    project_id = Column(
-        UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True
-    )
-    log_date = Column(Date, nullable=False, index=True)
+    # No separate user_id index: it is the leading column of uq_daily_log
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    # No separate project_id index: it leads ix_daily_logs_project_id_log_date
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
+    log_date = Column(Date, nullable=False, index=True, server_default=func.current_date())
+    # Week-sized bucket of log_date (days since 1970-01-01 divided by 7)
+    log_bucket = Column(Integer, Computed("(log_date - DATE '1970-01-01') / 7"))
 
     # Tasks worked on: [{card_id, time_spent (minutes), notes}]
     tasks_worked = Column(JSONB, default=list)
     remaining_work = Column(Text)
     blockers = Column(Text)
     notes = Column(Text)
+    # Sum of tasks_worked[*].time_spent in minutes, maintained by the database
+    total_time_spent = Column(Integer, Computed("daily_log_total_time(tasks_worked)"))
 
     # Relationships
     user = relationship("User", back_populates="daily_logs")
     project = relationship("Project", back_populates="daily_logs")
 
-    @property
-    def total_time_spent(self):
-        """Calculate total time spent in minutes."""
-        if not self.tasks_worked:
-            return 0
-        return sum(task.get("time_spent", 0) for task in self.tasks_worked)
+    @classmethod
+    def log_date_range(cls, start=None, end=None):
+        """Filter log_date to [start, end).
+
+        The plain log_date range stays usable for index range scans; the
+        matching log_bucket bounds are ANDed alongside for the bucket index.
+        """
+        clauses = []
+        if start is not None:
+            clauses += [cls.log_date >= start, cls.log_bucket >= log_bucket_for(start)]
+        if end is not None:
+            clauses += [cls.log_date < end, cls.log_bucket <= log_bucket_for(end)]
+        return and_(*clauses)
 
     def to_dict(self):
         """Serialize daily log to dictionary."""
@@ -59,3 +101,15 @@ class DailyLog(db.Model, UUIDMixin, TimestampMixin):
 
     def __repr__(self):
         return f"<DailyLog {self.user_id} {self.log_date}>"
+
+
+# Covering index for project-wide "latest logs" queries: ORDER BY log_date DESC
+# LIMIT n is answered by an index-only scan without visiting the heap.
+Index(
+    "ix_daily_logs_project_id_log_date",
+    DailyLog.project_id,
+    DailyLog.log_date.desc(),
+    postgresql_include=["user_id", "total_time_spent"],
+)
+
+event.listen(DailyLog.__table__, "before_create", TOTAL_TIME_FUNCTION)
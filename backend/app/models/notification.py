@@ -1,7 +1,7 @@
 """Notification model."""
 
 from enum import Enum
-from sqlalchemy import Column, String, Boolean, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -31,7 +31,8 @@ class Notification(db.Model, UUIDMixin, TimestampMixin):
 
     __tablename__ = "notifications"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    # No separate user_id index: it leads ix_notifications_user_id_created_at_id
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     type = Column(SQLEnum(NotificationType), nullable=False)
     title = Column(String(255), nullable=False)
     message = Column(Text)
@@ -77,3 +78,13 @@ class Notification(db.Model, UUIDMixin, TimestampMixin):
 
     def __repr__(self):
         return f"<Notification {self.type.value} for {self.user_id}>"
+
+
+# Keyset pagination index for a user's feed: each page is a backward scan
+# starting just below the (created_at, id) cursor of the previous page.
+Index(
+    "ix_notifications_user_id_created_at_id",
+    Notification.user_id,
+    Notification.created_at.desc(),
+    Notification.id.desc(),
+)
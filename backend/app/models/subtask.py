@@ -1,6 +1,6 @@
 """Subtask model - checklist items within a card."""
 
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -12,9 +12,13 @@ class Subtask(db.Model, UUIDMixin, TimestampMixin):
     """Subtask - checklist item within a card."""
 
     __tablename__ = "subtasks"
+    __table_args__ = (
+        # Serves both the per-card lookups and the ordered/max(position) scans
+        Index("ix_subtasks_card_id_position", "card_id", "position"),
+    )
 
     card_id = Column(
-        UUID(as_uuid=True), ForeignKey("cards.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("cards.id", ondelete="CASCADE"), nullable=False
     )
     title = Column(String(500), nullable=False)
     is_completed = Column(Boolean, default=False, nullable=False)
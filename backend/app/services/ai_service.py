@@ -283,8 +283,12 @@ Respond in JSON format:
             logger.error(f"AI retrospective summary generation failed: {e}")
             return None
 
-    def enhance_imported_tasks(self, tasks: list[dict]) -> Optional[dict]:
-        """Enhance imported tasks with AI suggestions and intelligent analysis."""
+    def enhance_imported_tasks(self, tasks: list[dict], structure: dict) -> Optional[dict]:
+        """Enhance imported tasks with AI suggestions and intelligent analysis.
+
+        One request covers both the per-task suggestions and the data quality
+        analysis of the import. Returns {"suggestions": ..., "analysis": ...}.
+        """
         if not self.enabled:
             return None
 
@@ -307,6 +311,11 @@ Respond in JSON format:
 
             prompt = f"""Analyze these imported tasks and provide intelligent enhancement suggestions:
 
+IMPORT STATISTICS:
+- Total tasks: {len(tasks)}
+- Column count: {structure.get('column_count', 'unknown')}
+- Header row: {structure.get('header_row_detected', 'row 1')}
+
 IMPORTED TASKS:
 {chr(10).join(tasks_summary)}
 
@@ -318,9 +327,11 @@ ANALYSIS REQUIRED:
 5. Flag potential duplicates or highly related tasks that could be merged
 6. Identify any tasks that should be broken down into subtasks
 7. Detect the overall project type and recommend workflow improvements
+8. Score the overall data quality and completeness of the import
 
 Respond in JSON format:
 {{
+  "suggestions": {{
     "enhanced_tasks": [
         {{
             "original_title": "...",
@@ -349,6 +360,19 @@ Respond in JSON format:
     }},
     "workflow_suggestions": ["suggestion 1", "suggestion 2"],
     "import_warnings": ["any concerns about the data quality"]
+  }},
+  "analysis": {{
+    "data_quality_score": <1-10>,
+    "completeness": {{
+        "has_good_titles": true/false,
+        "has_descriptions": true/false,
+        "has_estimates": true/false,
+        "has_priorities": true/false
+    }},
+    "recommendations": ["recommendation 1", "recommendation 2"],
+    "detected_project_type": "software|marketing|design|operations|general",
+    "suggested_workflow": "kanban|scrum|simple"
+  }}
 }}"""
 
             response = self.client.chat.completions.create(
@@ -365,10 +389,11 @@ For story points, consider: 1=trivial, 2=small, 3=medium, 5=large, 8=very large,
                     {"role": "user", "content": prompt},
                 ],
                 response_format={"type": "json_object"},
-                max_tokens=2000,
+                max_tokens=2500,
             )
 
-            return json.loads(response.choices[0].message.content)
+            result = json.loads(response.choices[0].message.content)
+            return {"suggestions": result.get("suggestions"), "analysis": result.get("analysis")}
         except Exception as e:
             logger.error(f"AI task enhancement failed: {e}")
             return None
@@ -0,0 +1,76 @@
+"""Background tasks run off the request thread.
+
+Jobs run on a small thread pool inside the web process, each in its own
+application context. There is no separate worker deployment yet; moving
+these to Celery only requires changing `submit`.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="flowboard-task")
+
+
+def submit(fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) in the background inside an app context."""
+    app = current_app._get_current_object()
+
+    def run():
+        with app.app_context():
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                logger.exception(f"Background task {fn.__name__} failed")
+                raise
+
+    return _executor.submit(run)
+
+
+def finalize_attachment(attachment_id, tmp_path, storage_path):
+    """Move an uploaded file into place, checksum it and mark it ready.
+
+    If this fails the attachment is marked "failed" and its partial file is
+    removed, so it never stays "uploading".
+    """
+    from .extensions import db
+    from .models import Attachment
+
+    attachment = db.session.get(Attachment, attachment_id)
+    if not attachment:
+        # Deleted while uploading
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+
+    try:
+        digest = hashlib.sha256()
+        with open(tmp_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        os.replace(tmp_path, storage_path)
+
+        if attachment.mime_type == "application/octet-stream":
+            guessed, _ = mimetypes.guess_type(attachment.filename)
+            if guessed:
+                attachment.mime_type = guessed
+
+        attachment.checksum = digest.hexdigest()
+        attachment.status = "ready"
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        for path in (tmp_path, storage_path):
+            if os.path.exists(path):
+                os.remove(path)
+        attachment = db.session.get(Attachment, attachment_id)
+        if attachment:
+            attachment.status = "failed"
+            db.session.commit()
+        raise
@@ -0,0 +1,91 @@
+"""Shared fixtures for API tests.
+
+Tests run against the PostgreSQL database of TestingConfig; the schema is
+created once per session and every test's rows are removed afterwards.
+"""
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.extensions import db
+from app.models import (
+    User, Organization, OrganizationMember, MemberRole, Workspace, Project, Board, Column, Card
+)
+
+
+@pytest.fixture(scope="session")
+def app():
+    app = create_app("testing")
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(app):
+    yield
+    db.session.rollback()
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(table.delete())
+    db.session.commit()
+
+
+@pytest.fixture
+def user(app):
+    user = User(email="dev@example.com", full_name="Dev")
+    user.set_password("password")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(user):
+    return {"Authorization": f"Bearer {create_access_token(identity=str(user.id))}"}
+
+
+@pytest.fixture
+def project(user):
+    organization = Organization(name="Acme", slug="acme")
+    db.session.add(organization)
+    db.session.flush()
+    db.session.add(OrganizationMember(
+        organization_id=organization.id, user_id=user.id, role=MemberRole.ADMIN
+    ))
+    workspace = Workspace(organization_id=organization.id, name="Engineering")
+    db.session.add(workspace)
+    db.session.flush()
+    project = Project(workspace_id=workspace.id, name="Flowboard")
+    db.session.add(project)
+    db.session.commit()
+    return project
+
+
+@pytest.fixture
+def board(project):
+    board = Board(project_id=project.id, name="Main")
+    db.session.add(board)
+    db.session.flush()
+    for position, name in enumerate(["To Do", "In Progress", "Done"]):
+        db.session.add(Column(board_id=board.id, name=name, position=position))
+    db.session.commit()
+    return board
+
+
+@pytest.fixture
+def columns(board):
+    return Column.query.filter_by(board_id=board.id).order_by(Column.position).all()
+
+
+@pytest.fixture
+def make_card(user):
+    def make_card(column, title="Card", position=0):
+        card = Card(column_id=column.id, title=title, position=position, created_by=user.id)
+        db.session.add(card)
+        db.session.commit()
+        return card
+    return make_card
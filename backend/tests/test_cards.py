@@ -0,0 +1,118 @@
+"""Card endpoint tests."""
+
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import tasks
+from app.extensions import db
+from app.models import Attachment, Card, User
+
+
+def column_titles(column):
+    return [card.title for card in Card.query.filter_by(column_id=column.id).order_by(Card.position)]
+
+
+def test_move_card_makes_room_in_target_column(client, auth_headers, columns, make_card):
+    todo, in_progress, _ = columns
+    card = make_card(todo, "Move me")
+    make_card(in_progress, "First", position=0)
+    make_card(in_progress, "Second", position=1)
+
+    response = client.put(
+        f"/api/cards/{card.id}/move",
+        json={"column_id": str(in_progress.id), "position": 1},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json["card"]["column_id"] == str(in_progress.id)
+    assert response.json["card"]["position"] == 1
+    assert column_titles(in_progress) == ["First", "Move me", "Second"]
+    assert column_titles(todo) == []
+
+
+def test_assign_and_unassign_card(client, auth_headers, user, columns, make_card):
+    card = make_card(columns[0])
+    url = f"/api/cards/{card.id}/assignees"
+
+    assigned = client.post(url, json={"user_id": str(user.id)}, headers=auth_headers)
+    assert assigned.status_code == 200
+    assert [a["user_id"] for a in assigned.json["card"]["assignees"]] == [str(user.id)]
+
+    duplicate = client.post(url, json={"user_id": str(user.id)}, headers=auth_headers)
+    assert duplicate.status_code == 409
+
+    unassigned = client.delete(f"{url}/{user.id}", headers=auth_headers)
+    assert unassigned.status_code == 200
+    assert unassigned.json["card"]["assignees"] == []
+
+
+def test_card_routes_require_membership(client, columns, make_card):
+    outsider = User(email="outsider@example.com")
+    outsider.set_password("password")
+    db.session.add(outsider)
+    db.session.commit()
+    card = make_card(columns[0])
+
+    response = client.get(
+        f"/api/cards/{card.id}",
+        headers={"Authorization": f"Bearer {create_access_token(identity=str(outsider.id))}"},
+    )
+
+    assert response.status_code == 403
+
+
+def add_attachment(card, tmp_path, **values):
+    attachment = Attachment(
+        card_id=card.id,
+        filename="notes.txt",
+        storage_path=str(tmp_path / "notes.txt"),
+        file_size=5,
+        mime_type="text/plain",
+        status="uploading",
+        **values,
+    )
+    db.session.add(attachment)
+    db.session.commit()
+    return attachment
+
+
+def test_failed_finalize_marks_attachment_failed(columns, make_card, tmp_path):
+    attachment = add_attachment(make_card(columns[0]), tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        tasks.finalize_attachment(attachment.id, str(tmp_path / "missing.part"), attachment.storage_path)
+
+    assert db.session.get(Attachment, attachment.id).status == "failed"
+
+
+def test_finalize_marks_attachment_ready(columns, make_card, tmp_path):
+    attachment = add_attachment(make_card(columns[0]), tmp_path)
+    part_path = tmp_path / "notes.txt.part"
+    part_path.write_bytes(b"hello")
+
+    tasks.finalize_attachment(attachment.id, str(part_path), attachment.storage_path)
+
+    attachment = db.session.get(Attachment, attachment.id)
+    assert attachment.status == "ready"
+    assert attachment.checksum == hashlib.sha256(b"hello").hexdigest()
+    assert not part_path.exists()
+
+
+def test_stale_upload_is_reported_as_failed(client, auth_headers, columns, make_card, tmp_path):
+    card = make_card(columns[0])
+    stale = add_attachment(card, tmp_path, created_at=datetime.utcnow() - timedelta(hours=1))
+    fresh = add_attachment(card, tmp_path)
+
+    listed = client.get(f"/api/cards/{card.id}/attachments", headers=auth_headers)
+    statuses = {a["id"]: a["status"] for a in listed.json["attachments"]}
+    assert statuses == {str(stale.id): "failed", str(fresh.id): "uploading"}
+
+    download = client.get(
+        f"/api/cards/{card.id}/attachments/{stale.id}/download", headers=auth_headers
+    )
+    assert download.status_code == 409
+    assert download.json["error"] == "Attachment upload failed, please upload it again"
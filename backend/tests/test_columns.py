@@ -0,0 +1,58 @@
+"""Column endpoint tests."""
+
+
+def test_create_column_appends_after_last_position(client, auth_headers, board, columns):
+    response = client.post(
+        "/api/columns/",
+        json={"board_id": str(board.id), "name": "Review", "wip_limit": 3},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 201
+    assert response.json["column"]["name"] == "Review"
+    assert response.json["column"]["position"] == len(columns)
+    assert response.json["column"]["card_count"] == 0
+
+
+def test_reorder_columns(client, auth_headers, columns):
+    column_ids = [str(column.id) for column in reversed(columns)]
+
+    response = client.put(
+        "/api/columns/reorder", json={"column_ids": column_ids}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json["columns"]] == column_ids
+    assert [c["position"] for c in response.json["columns"]] == [0, 1, 2]
+
+
+def test_get_column_revalidates_with_etag(client, auth_headers, columns, make_card):
+    column = columns[0]
+    make_card(column)
+
+    first = client.get(f"/api/columns/{column.id}", headers=auth_headers)
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+
+    cached = client.get(
+        f"/api/columns/{column.id}",
+        headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_get_column_etag_changes_when_card_assigned(client, auth_headers, user, columns, make_card):
+    column = columns[0]
+    card = make_card(column)
+    etag = client.get(f"/api/columns/{column.id}", headers=auth_headers).headers["ETag"]
+
+    assigned = client.post(
+        f"/api/cards/{card.id}/assignees", json={"user_id": str(user.id)}, headers=auth_headers
+    )
+    assert assigned.status_code == 200
+
+    response = client.get(
+        f"/api/columns/{column.id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json["column"]["cards"][0]["assignees"][0]["user_id"] == str(user.id)
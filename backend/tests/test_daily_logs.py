@@ -0,0 +1,119 @@
+"""Daily log endpoint tests."""
+
+from datetime import date, timedelta
+
+from app.extensions import db
+from app.models import DailyLog
+from app.models.daily_log import log_bucket_for
+
+
+def test_today_without_log_returns_suggestions(client, auth_headers, project):
+    response = client.get(
+        f"/api/daily-logs/today?project_id={project.id}", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json["daily_log"] is None
+    assert response.json["suggestions"] == []
+
+
+def test_today_returns_log_created_today(client, auth_headers, project):
+    created = client.post(
+        "/api/daily-logs/",
+        json={"project_id": str(project.id), "notes": "Reviewed PRs"},
+        headers=auth_headers,
+    )
+    assert created.status_code == 201
+
+    response = client.get(
+        f"/api/daily-logs/today?project_id={project.id}", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json["daily_log"]["id"] == created.json["daily_log"]["id"]
+    assert response.json["daily_log"]["log_date"] == date.today().isoformat()
+
+
+def test_suggestions_include_yesterdays_remaining_work(client, auth_headers, user, project):
+    db.session.add(DailyLog(
+        user_id=user.id,
+        project_id=project.id,
+        log_date=date.today() - timedelta(days=1),
+        remaining_work="Finish the importer",
+    ))
+    db.session.commit()
+
+    response = client.get(
+        f"/api/daily-logs/suggestions?project_id={project.id}", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json["suggestions"] == [{
+        "card_id": None,
+        "title": "Remaining work from yesterday",
+        "description": "Finish the importer",
+        "reason": "yesterday_remaining",
+    }]
+
+
+def test_list_filters_by_date_range(client, auth_headers, user, project):
+    for day in (date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 20), date(2024, 1, 21)):
+        db.session.add(DailyLog(user_id=user.id, project_id=project.id, log_date=day))
+    db.session.commit()
+
+    response = client.get(
+        f"/api/daily-logs/?project_id={project.id}&start_date=2024-01-07&end_date=2024-01-20",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert [log["log_date"] for log in response.json["daily_logs"]] == ["2024-01-20", "2024-01-07"]
+
+
+def test_log_bucket_for_matches_sql_division_before_1970():
+    assert log_bucket_for(date(1969, 12, 31)) == 0
+    assert log_bucket_for(date(1969, 12, 24)) == -1
+    assert log_bucket_for(date(1970, 1, 8)) == 1
+
+
+def test_get_daily_log_revalidates_with_etag(client, auth_headers, user, project):
+    log = DailyLog(user_id=user.id, project_id=project.id, notes="Standup")
+    db.session.add(log)
+    db.session.commit()
+    url = f"/api/daily-logs/{log.id}"
+
+    first = client.get(url, headers=auth_headers)
+    assert first.status_code == 200
+
+    cached = client.get(url, headers={**auth_headers, "If-None-Match": first.headers["ETag"]})
+    assert cached.status_code == 304
+
+    client.post(
+        "/api/daily-logs/",
+        json={"project_id": str(project.id), "notes": "Standup, then pairing"},
+        headers=auth_headers,
+    )
+    changed = client.get(url, headers={**auth_headers, "If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert changed.json["daily_log"]["notes"] == "Standup, then pairing"
+
+
+def test_summary_counts_logs_within_window(client, auth_headers, user, project, columns, make_card):
+    card = make_card(columns[0])
+    for days_ago, minutes in ((0, 30), (3, 45), (10, 60)):
+        db.session.add(DailyLog(
+            user_id=user.id,
+            project_id=project.id,
+            log_date=date.today() - timedelta(days=days_ago),
+            tasks_worked=[{"card_id": str(card.id), "time_spent": minutes}],
+        ))
+    db.session.commit()
+
+    response = client.get(
+        f"/api/daily-logs/summary?project_id={project.id}&days=7", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json["summary"]["days_logged"] == 2
+    assert response.json["summary"]["total_time_minutes"] == 75
+    assert response.json["summary"]["card_breakdown"] == {str(card.id): 75}
@@ -0,0 +1,48 @@
+"""Import column detection tests."""
+
+from app.api.imports import normalize_sample, smart_detect_column_mapping
+
+
+def detect_mapping(headers, rows=()):
+    mapping, _, _ = smart_detect_column_mapping(headers, normalize_sample(headers, list(rows)), {})
+    return mapping
+
+
+def test_spaced_headers_map_to_fields():
+    mapping = detect_mapping(["Summary", "Story Points", "Assigned To", "Due Date", "Labels"])
+
+    assert mapping["title"] == "Summary"
+    assert mapping["story_points"] == "Story Points"
+    assert mapping["assignee"] == "Assigned To"
+    assert mapping["due_date"] == "Due Date"
+    assert mapping["labels"] == "Labels"
+
+
+def test_camel_case_and_joined_headers_map_to_fields():
+    mapping = detect_mapping(["TaskName", "DueDate", "Storypoints", "AssignedTo"])
+
+    assert mapping["title"] == "TaskName"
+    assert mapping["due_date"] == "DueDate"
+    assert mapping["story_points"] == "Storypoints"
+    assert mapping["assignee"] == "AssignedTo"
+
+
+def test_short_keywords_do_not_match_inside_words():
+    mapping = detect_mapping(["Title", "Stage", "Spend"])
+
+    assert mapping["status"] == "Stage"
+    assert mapping["labels"] is None
+    assert mapping["story_points"] is None
+    assert mapping["due_date"] is None
+
+
+def test_known_jira_export_maps_directly():
+    headers = ["Issue key", "Issue Type", "Summary", "Description", "Priority", "Status", "Assignee"]
+
+    mapping = detect_mapping(headers)
+
+    assert mapping["title"] == "Summary"
+    assert mapping["description"] == "Description"
+    assert mapping["priority"] == "Priority"
+    assert mapping["status"] == "Status"
+    assert mapping["assignee"] == "Assignee"
@@ -0,0 +1,68 @@
+"""Notification endpoint tests."""
+
+from datetime import datetime, timedelta
+
+from app.extensions import db
+from app.models import Notification, NotificationType
+
+
+def add_notifications(user, count):
+    # Pairs share a timestamp so pages must also be ordered by id
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        db.session.add(Notification(
+            user_id=user.id,
+            type=NotificationType.CARD_ASSIGNED,
+            title=f"Notification {i}",
+            created_at=start + timedelta(minutes=i // 2),
+        ))
+    db.session.commit()
+
+
+def test_cursor_pages_cover_every_notification_once(client, auth_headers, user):
+    add_notifications(user, 7)
+    expected = [
+        str(n.id) for n in Notification.query.order_by(
+            Notification.created_at.desc(), Notification.id.desc()
+        )
+    ]
+
+    seen, cursor = [], None
+    while True:
+        url = "/api/notifications?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        seen += [n["id"] for n in response.json["notifications"]]
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_last_page_has_no_next_cursor(client, auth_headers, user):
+    add_notifications(user, 3)
+
+    response = client.get("/api/notifications?limit=3", headers=auth_headers)
+
+    assert len(response.json["notifications"]) == 3
+    assert response.json["next_cursor"] is None
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers):
+    response = client.get("/api/notifications?cursor=not-a-cursor", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Invalid cursor"
+
+
+def test_unread_count_only_on_first_page(client, auth_headers, user):
+    add_notifications(user, 4)
+
+    first = client.get("/api/notifications?limit=2", headers=auth_headers)
+    second = client.get(
+        f"/api/notifications?limit=2&cursor={first.json['next_cursor']}", headers=auth_headers
+    )
+
+    assert first.json["unread_count"] == 4
+    assert "unread_count" not in second.json
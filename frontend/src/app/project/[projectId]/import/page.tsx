@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useCallback, useEffect } from "react";
+import { useState, useCallback, useEffect, useRef } from "react";
 import { useParams, useRouter } from "next/navigation";
 import {
   Upload,
@@ -104,6 +104,7 @@ interface ProcessedImport {
     detected_project_type: string;
     suggested_workflow: string;
   } | null;
+  ai_status?: "pending" | "ready" | null;
   column_mapping: Record<string, string | null>;
   processing_insights?: {
     tasks_extracted: number;
@@ -117,6 +118,9 @@ interface ProcessedImport {
 
 type Step = "upload" | "preview" | "mapping" | "process" | "confirm";
 
+// AI results are polled every second for at most two minutes
+const AI_POLL_MAX_ATTEMPTS = 120;
+
 export default function ImportPage() {
   const params = useParams();
   const router = useRouter();
@@ -140,11 +144,21 @@ export default function ImportPage() {
     story_points: null,
   });
   const [useAI, setUseAI] = useState(true);
+  // Bumped to abandon an in-flight AI poll; each poll keeps the value it started with
+  const aiPollRef = useRef(0);
 
   useEffect(() => {
     setMounted(true);
+    return () => {
+      aiPollRef.current++;
+    };
   }, []);
 
+  // Leaving the confirm step ends the AI poll for the import shown there
+  useEffect(() => {
+    if (step !== "confirm") aiPollRef.current++;
+  }, [step]);
+
   const handleDragOver = useCallback((e: React.DragEvent) => {
     e.preventDefault();
     setIsDragging(true);
@@ -231,6 +245,9 @@ export default function ImportPage() {
       });
       setProcessedImport(response);
       setStep("confirm");
+      if (response.ai_status === "pending") {
+        pollAiAnalysis(response.import_id);
+      }
     } catch (err: any) {
       setError(err.message || "Failed to process import");
     } finally {
@@ -238,11 +255,40 @@ export default function ImportPage() {
     }
   };
 
+  // AI results arrive later; poll until they are ready, the user moves on or we give up
+  const pollAiAnalysis = async (importId: string) => {
+    const pollId = ++aiPollRef.current;
+    try {
+      for (let attempt = 0; attempt < AI_POLL_MAX_ATTEMPTS; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        if (aiPollRef.current !== pollId) return;
+
+        const ai = await importApi.getAiAnalysisStatus(importId);
+        if (aiPollRef.current !== pollId) return;
+
+        if (ai.ai_status !== "pending") {
+          if (ai.ai_status === "ready") {
+            setProcessedImport((current) =>
+              current && current.import_id === importId
+                ? { ...current, ai_suggestions: ai.ai_suggestions, ai_analysis: ai.ai_analysis }
+                : current
+            );
+          }
+          return;
+        }
+      }
+    } catch (err) {
+      // AI suggestions are optional; the import itself already succeeded
+    }
+  };
+
   const handleConfirm = async () => {
     if (!processedImport) return;
 
     setError(null);
     setIsConfirming(true);
+    // Confirming deletes the session, so stop asking for its AI results
+    aiPollRef.current++;
 
     try {
       const response = await importApi.confirm(processedImport.import_id, {
@@ -259,6 +305,7 @@ export default function ImportPage() {
   };
 
   const handleCancel = async () => {
+    aiPollRef.current++;
     if (importSession) {
       try {
         await importApi.cancel(importSession.import_id);
@@ -1,7 +1,7 @@
 "use client";
 
-import { useState, useRef } from "react";
-import { Paperclip, Upload, Trash2, Download, FileText, Image, File } from "lucide-react";
+import { useState, useRef, useEffect } from "react";
+import { Paperclip, Upload, Trash2, Download, FileText, Image, File, AlertCircle } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { attachmentsApi } from "@/lib/api";
 import type { Attachment } from "@/types";
@@ -39,6 +39,23 @@ export function AttachmentsList({ cardId, attachments, onAttachmentsChange }: At
   const [error, setError] = useState<string | null>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
+  // Uploads are finalized in the background; refresh until none is pending
+  const hasPending = attachments.some((a) => a.status === "uploading");
+  useEffect(() => {
+    if (!hasPending) return;
+
+    const timeout = setTimeout(async () => {
+      try {
+        const data = await attachmentsApi.list(cardId);
+        onAttachmentsChange(data.attachments);
+      } catch (err) {
+        console.error("Failed to refresh attachments:", err);
+      }
+    }, 2000);
+
+    return () => clearTimeout(timeout);
+  }, [cardId, attachments, hasPending, onAttachmentsChange]);
+
   const handleFileSelect = async (event: React.ChangeEvent<HTMLInputElement>) => {
     const files = event.target.files;
     if (!files || files.length === 0) return;
@@ -180,18 +197,26 @@ export function AttachmentsList({ cardId, attachments, onAttachmentsChange }: At
                   {attachment.uploaded_by_user && (
                     <> &middot; {attachment.uploaded_by_user.full_name || attachment.uploaded_by_user.email}</>
                   )}
+                  {attachment.status === "uploading" && <> &middot; Processing...</>}
+                  {attachment.status === "failed" && (
+                    <span className="text-red-600">
+                      {" "}&middot; <AlertCircle className="inline h-3 w-3" /> Upload failed
+                    </span>
+                  )}
                 </div>
               </div>
 
               {/* Actions */}
               <div className="flex-shrink-0 flex items-center gap-1 opacity-0 group-hover:opacity-100 transition-opacity">
-                <button
-                  onClick={() => handleDownload(attachment)}
-                  className="rounded p-1 text-gray-400 hover:bg-gray-100 hover:text-blue-600"
-                  title="Download"
-                >
-                  <Download className="h-4 w-4" />
-                </button>
+                {attachment.status === "ready" && (
+                  <button
+                    onClick={() => handleDownload(attachment)}
+                    className="rounded p-1 text-gray-400 hover:bg-gray-100 hover:text-blue-600"
+                    title="Download"
+                  >
+                    <Download className="h-4 w-4" />
+                  </button>
+                )}
                 <button
                   onClick={() => handleDelete(attachment.id)}
                   disabled={deleting === attachment.id}
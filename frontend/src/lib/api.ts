@@ -690,6 +690,10 @@ export const analyticsApi = {
 };
 
 // Import API
+
+// Upload analysis is polled every 500ms for at most two minutes
+const IMPORT_POLL_MAX_ATTEMPTS = 240;
+
 export const importApi = {
   upload: async (projectId: string, file: File) => {
     const formData = new FormData();
@@ -700,6 +704,22 @@ export const importApi = {
         "Content-Type": "multipart/form-data",
       },
     });
+
+    // The file is analyzed in the background; poll until the preview is ready,
+    // giving up if the job was lost (e.g. the worker restarted)
+    let data = response.data;
+    for (let attempt = 0; data.status === "processing"; attempt++) {
+      if (attempt >= IMPORT_POLL_MAX_ATTEMPTS) {
+        throw new Error("Analyzing the file is taking too long. Please try uploading it again.");
+      }
+      await new Promise((resolve) => setTimeout(resolve, 500));
+      data = (await api.get(`/import/${data.import_id}/status`)).data;
+    }
+    return data;
+  },
+
+  getStatus: async (importId: string) => {
+    const response = await api.get(`/import/${importId}/status`);
     return response.data;
   },
 
@@ -717,6 +737,12 @@ export const importApi = {
     return response.data;
   },
 
+  // AI suggestions and analysis are generated in the background after process
+  getAiAnalysisStatus: async (importId: string) => {
+    const response = await api.get(`/import/${importId}/ai-analysis-status`);
+    return response.data;
+  },
+
   confirm: async (importId: string, data: {
     tasks: Array<{ title: string; description?: string | null; priority?: string | null; story_points?: number | null }>;
     board_id?: string;
@@ -748,7 +774,7 @@ export const importApi = {
 
 // Notifications API
 export const notificationsApi = {
-  list: async (params?: { unread_only?: boolean; limit?: number; offset?: number }) => {
+  list: async (params?: { unread_only?: boolean; limit?: number; cursor?: string }) => {
     const response = await api.get("/notifications", { params });
     return response.data;
   },
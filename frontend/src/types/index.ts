@@ -151,6 +151,8 @@ export interface Attachment {
   filename: string;
   file_size: number;
   mime_type: string | null;
+  status: "uploading" | "ready" | "failed";
+  checksum: string | null;
   uploaded_by: string | null;
   uploaded_by_user: User | null;
   created_at: string;